@@ -132,8 +132,12 @@ class Imputer(transformer.Imputer):
                 return set()
             return set([colname])
 
-        char_cols_low = [x.lower() for x in char_cols]
-        num_cols_low = [x.lower() for x in num_cols]
+        char_cols_low = set(x.lower() for x in char_cols)
+        num_cols_low = set(x.lower() for x in num_cols)
+        all_cols_low = char_cols_low | num_cols_low
+
+        # Character max / min values only need to be fetched once per statistic
+        char_extremes = set()
 
         for col, repl in value.items():
             if isinstance(repl, transformer.ImputerMethod):
@@ -141,14 +145,15 @@ class Imputer(transformer.Imputer):
 
                 if repl in ['mode']:
                     char_stats.setdefault(repl, set())\
-                              .update(get_col_names(col, char_cols_low + num_cols_low))
+                              .update(get_col_names(col, all_cols_low))
 
                 elif repl in ['mean', 'median', 'midrange', 'random']:
                     num_stats.setdefault(repl, set()).update(get_col_names(col, num_cols_low))
 
                 elif repl in ['max', 'min']:
                     num_stats.setdefault(repl, set()).update(get_col_names(col, num_cols_low))
-                    if char_cols:
+                    if char_cols and repl not in char_extremes:
+                        char_extremes.add(repl)
                         for key, value in getattr(table[char_cols], repl)().iteritems():
                             char_const.setdefault(value, set()).update([key])
 
@@ -37,5 +37,6 @@ def get_columns(table):
     dtypes = table.dtypes
     columns = list(dtypes.index)
     char_cols = list(dtypes[dtypes.isin(['char', 'varchar', 'binary', 'varbinary'])].index)
-    num_cols = [x for x in columns if x not in set(char_cols)]
+    char_set = set(char_cols)
+    num_cols = [x for x in columns if x not in char_set]
     return columns, char_cols, num_cols
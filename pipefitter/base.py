@@ -107,19 +107,25 @@ class PolySuperMixIn(object):
             class name of `self`.
         cache : boolean, optional
             Should the result of this operation be cached for 
-            future calls? 
+            future calls?  The cached object is only reused for
+            data sets of the same type and the same class name.
+            It is built from the parameters at the time of the
+            first call, so only enable this when later parameter
+            changes don't need to reach the backend object.
 
         Returns
         -------
         Specified class from the appropriate backend package
 
         '''
-        if getattr(self, '@super', None) is not None:
-            return getattr(self, '@super')
-
         if name is None:
             name = self.__class__.__name__
 
+        key = (type(obj), name)
+        if getattr(self, '@super', None) is not None \
+                and getattr(self, '@super-key', None) == key:
+            return getattr(self, '@super')
+
         try:
             out = getattr(get_super_module(obj), name)(**self.get_params())
         except AttributeError:
@@ -128,6 +134,7 @@ class PolySuperMixIn(object):
 
         if cache:
             setattr(self, '@super', out)
+            setattr(self, '@super-key', key)
 
         return out
 
@@ -23,9 +23,6 @@ Tests for CAS Estimators
 
 from __future__ import print_function, division, absolute_import, unicode_literals
 
-import os
-import numpy as np
-import pandas as pd
 import swat
 import swat.utils.testing as tm
 import unittest
@@ -45,11 +42,17 @@ class TestUtils(tm.TestCase):
 
     server_type = None
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         swat.reset_option()
         swat.options.cas.print_messages = True
         swat.options.interactive_mode = False
 
+    @classmethod
+    def tearDownClass(cls):
+        swat.reset_option()
+
+    def setUp(self):
         self.s = swat.CAS(HOST, PORT, USER, PASSWD, protocol=PROTOCOL)
 
         if type(self).server_type is None:
@@ -63,21 +66,26 @@ class TestUtils(tm.TestCase):
 
         self.table = r['casTable']
 
+        # Set by tests that promote the table; session-scoped tables
+        # go away with the session, so only global ones need dropping
+        self._table_dirty = False
+
     def tearDown(self):
         # tear down tests
-        self.s.table.droptable('datasources.cars_single', caslib=self.srcLib,
-                               _messagelevel='none')
+        if self._table_dirty:
+            self.s.table.droptable('datasources.cars_single', caslib=self.srcLib,
+                                   _messagelevel='none')
         self.s.terminate()
         del self.s
-        swat.reset_option()
 
     def test_is_parallelizable(self):
         tbl = self.table
         with ResourceManager() as mgr:
-            self.assertEqual(tbl.tableinfo().TableInfo.loc[0, 'Global'], 0)
+            self.assertEqual(tbl.tableinfo().TableInfo['Global'].iat[0], 0)
             self.assertTrue(mgr.is_parallelizable(tbl) is False) 
             tbl.table.promote(drop=True)
-            self.assertEqual(tbl.tableinfo().TableInfo.loc[0, 'Global'], 1)
+            self._table_dirty = True
+            self.assertEqual(tbl.tableinfo().TableInfo['Global'].iat[0], 1)
             self.assertTrue(mgr.is_parallelizable(tbl) is True) 
 
     def test_emancipate(self):
@@ -85,6 +93,7 @@ class TestUtils(tm.TestCase):
         with ResourceManager() as mgr:
             self.assertEqual(mgr.emancipate(), [])
             tbl.table.promote()
+            self._table_dirty = True
             tbl1, tbl2 = mgr.emancipate(tbl, tbl)             
             self.assertEqual(tbl1.name, tbl.name)
             self.assertEqual(tbl1.caslib, tbl.caslib)
@@ -107,64 +116,39 @@ class TestUtils(tm.TestCase):
             mgr.track_table(self.table)
         self.assertEqual(self.table.tableexists().exists, 0)
             
+    def _assert_split_shape(self, out, n_folds):
+        self.assertEqual(len(out), n_folds)
+        for i, pair in enumerate(out):
+            msg = 'fold %d' % i
+            self.assertIsInstance(pair, tuple, msg=msg)
+            self.assertEqual(len(pair), 2, msg=msg)
+            for tbl in pair:
+                self.assertIsInstance(tbl, swat.CASTable, msg=msg)
+
     def test_split_data_by_int(self):
         with ResourceManager() as mgr:
             out = mgr.split_data(self.table, k=3) 
-
-            self.assertEqual(len(out), 3)
-            self.assertTrue(isinstance(out[0], tuple))
-            self.assertTrue(isinstance(out[1], tuple))
-            self.assertTrue(isinstance(out[2], tuple))
-            self.assertEqual(len(out[0]), 2)
-            self.assertEqual(len(out[1]), 2)
-            self.assertEqual(len(out[2]), 2)
-            self.assertEqual(out[0][0].__class__.__name__, 'CASTable')
-            self.assertEqual(out[0][1].__class__.__name__, 'CASTable')
-            self.assertEqual(out[1][0].__class__.__name__, 'CASTable')
-            self.assertEqual(out[1][1].__class__.__name__, 'CASTable')
-            self.assertEqual(out[2][0].__class__.__name__, 'CASTable')
-            self.assertEqual(out[2][1].__class__.__name__, 'CASTable')
-
+            self._assert_split_shape(out, 3)
             self.assertEqual(len(mgr.tables), 1)
 
             self.table.table.promote(drop=True)
+            self._table_dirty = True
         
             out = mgr.split_data(self.table, k=2)
-
-            self.assertEqual(len(out), 2)
-            self.assertTrue(isinstance(out[0], tuple))
-            self.assertTrue(isinstance(out[1], tuple))
-            self.assertEqual(len(out[0]), 2)
-            self.assertEqual(len(out[1]), 2)
-            self.assertEqual(out[0][0].__class__.__name__, 'CASTable')
-            self.assertEqual(out[0][1].__class__.__name__, 'CASTable')
-            self.assertEqual(out[1][0].__class__.__name__, 'CASTable')
-            self.assertEqual(out[1][1].__class__.__name__, 'CASTable')
-
+            self._assert_split_shape(out, 2)
             self.assertEqual(len(mgr.tables), 2)
 
     def test_split_data_by_float(self):
         with ResourceManager() as mgr:
             out = mgr.split_data(self.table, k=0.3)
-
-            self.assertEqual(len(out), 1)
-            self.assertTrue(isinstance(out[0], tuple))
-            self.assertEqual(len(out[0]), 2)
-            self.assertEqual(out[0][0].__class__.__name__, 'CASTable')
-            self.assertEqual(out[0][1].__class__.__name__, 'CASTable')
-
+            self._assert_split_shape(out, 1)
             self.assertEqual(len(mgr.tables), 1)
 
             self.table.table.promote(drop=True)
+            self._table_dirty = True
 
             out = mgr.split_data(self.table, k=0.4)
-
-            self.assertEqual(len(out), 1)
-            self.assertTrue(isinstance(out[0], tuple))
-            self.assertEqual(len(out[0]), 2)
-            self.assertEqual(out[0][0].__class__.__name__, 'CASTable')
-            self.assertEqual(out[0][1].__class__.__name__, 'CASTable')
-
+            self._assert_split_shape(out, 1)
             self.assertEqual(len(mgr.tables), 2)
 
 
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright SAS Institute
+#
+#  Licensed under the Apache License, Version 2.0 (the License);
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+'''
+pytest configuration for the test suite
+
+Tests under the ``cas`` and ``sas`` directories require a running
+server and are marked ``slow``.  All other tests are pure Python and
+are marked ``fast``.  Use ``pytest -m fast`` for a quick check.
+
+'''
+
+from __future__ import print_function, division, absolute_import, unicode_literals
+
+import os
+import pytest
+
+_SLOW_DIRS = set(['cas', 'sas'])
+
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'fast: pure Python tests')
+    config.addinivalue_line('markers', 'slow: tests requiring a CAS or SAS server')
+
+
+def pytest_collection_modifyitems(config, items):
+    for item in items:
+        dirname = os.path.basename(os.path.dirname(str(item.fspath)))
+        if dirname in _SLOW_DIRS:
+            item.add_marker(pytest.mark.slow)
+        else:
+            item.add_marker(pytest.mark.fast)
@@ -23,8 +23,6 @@ Tests for CAS Estimators
 
 from __future__ import print_function, division, absolute_import, unicode_literals
 
-import os
-import numpy as np
 import pandas as pd
 import saspy
 import unittest
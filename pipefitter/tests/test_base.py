@@ -37,6 +37,27 @@ from pipefitter.base import (_BACKEND_MAP, register_backend, unregister_backend,
                              BaseGridSearchCV, BaseModel, ResourceManager)
 
 
+# Mock objects.  Backends are matched on the end of the class name.
+class _FakeCASTable(object):
+    pass
+
+
+class _FakeSASdata(object):
+    pass
+
+
+class _FakeUnknownData(object):
+    pass
+
+
+class _FakeConnection(object):
+    pass
+
+
+class _FakeModel(BaseModel):
+    pass
+
+
 class TestRegistry(tm.TestCase):
 
     def setUp(self):
@@ -60,55 +81,50 @@ class TestRegistry(tm.TestCase):
 class TestSuperModule(tm.TestCase):
 
     def test_get_super_module(self):
-        # Create mock objects
-        class CASTable(object):
-            pass
-        class SASdata(object):
-            pass
-        class FooBar(object):
-            pass
-
-        self.assertEqual(get_super_module(CASTable()), pipefitter.backends.cas)
-        self.assertEqual(get_super_module(SASdata()), pipefitter.backends.sas)
+        self.assertEqual(get_super_module(_FakeCASTable()), pipefitter.backends.cas)
+        self.assertEqual(get_super_module(_FakeSASdata()), pipefitter.backends.sas)
 
         with self.assertRaises(ValueError):
-            get_super_module(FooBar())
+            get_super_module(_FakeUnknownData())
 
     def test_mixin(self):
-        # Create mock objects
-        class CASTable(object):
-            pass
-        class SASdata(object):
-            pass
-
         class Imputer(ParameterManager, PolySuperMixIn):
             pass
 
         imp = Imputer()
 
         # Test backends
-        casimp = imp._get_super(CASTable())
+        casimp = imp._get_super(_FakeCASTable())
         self.assertEqual(casimp.__class__.__name__, 'Imputer')
         self.assertEqual(casimp.__module__, 'pipefitter.backends.cas.transformer.imputer')
+        self.assertFalse(hasattr(imp, '@super'))
+        self.assertTrue(imp._get_super(_FakeCASTable()) is not casimp)
 
-        sasimp = imp._get_super(SASdata())
+        sasimp = imp._get_super(_FakeSASdata())
         self.assertEqual(sasimp.__class__.__name__, 'Imputer')
         self.assertEqual(sasimp.__module__, 'pipefitter.backends.sas.transformer.imputer')
 
         # Test explicit name
-        tree = imp._get_super(CASTable(), name='DecisionTree')
+        tree = imp._get_super(_FakeCASTable(), name='DecisionTree')
         self.assertEqual(tree.__class__.__name__, 'DecisionTree')
         self.assertEqual(tree.__module__, 'pipefitter.backends.cas.estimator.tree')
 
         # Test bad explicit name
         with self.assertRaises(AttributeError): 
-            imp._get_super(CASTable(), name='Foo')
+            imp._get_super(_FakeCASTable(), name='Foo')
 
         # Test caching
-        casimp = imp._get_super(CASTable(), cache=True)
+        casimp = imp._get_super(_FakeCASTable(), cache=True)
         self.assertTrue(hasattr(imp, '@super'))
         self.assertTrue(getattr(imp, '@super') is casimp)
-        self.assertTrue(imp._get_super(CASTable()) is casimp)
+        self.assertTrue(imp._get_super(_FakeCASTable(), cache=True) is casimp)
+
+        # Cached object is not reused for other backends or names
+        sasimp = imp._get_super(_FakeSASdata(), cache=True)
+        self.assertEqual(sasimp.__module__, 'pipefitter.backends.sas.transformer.imputer')
+        tree = imp._get_super(_FakeSASdata(), name='DecisionTree', cache=True)
+        self.assertEqual(tree.__class__.__name__, 'DecisionTree')
+        self.assertEqual(tree.__module__, 'pipefitter.backends.sas.estimator.tree')
 
 
 class TestBaseClasses(tm.TestCase):
@@ -148,10 +164,7 @@ class TestBaseClasses(tm.TestCase):
             BaseEstimator().score
 
     def test_BaseModel(self):
-        class CASTable(object):
-            pass
-
-        table = CASTable()
+        table = _FakeCASTable()
         params = dict()
 
         model = BaseModel(table, params, dict(c=3),
@@ -180,31 +193,21 @@ class TestBaseClasses(tm.TestCase):
         self.assertTrue(model._check_backend(table) is None)
         
         # Test backend for bad data
-        class UnknownData(object):
-            pass
-
         model = BaseModel(table, params, dict(c=3),
                           backend=pipefitter.backends.cas)
 
         with self.assertRaises(ValueError):
-            model._check_backend(UnknownData())
+            model._check_backend(_FakeUnknownData())
 
 
 class TestResourceManager(tm.TestCase):
 
     def test_context_manager(self):
-        class CASTable(object):
-            pass
-        class TestModel(BaseModel):
-            pass
-        class TestConnection(object):
-            pass
-
-        table1 = CASTable()
-        table2 = CASTable()
-        model = TestModel(table1, dict())
-        conn1 = TestConnection()
-        conn2 = TestConnection()
+        table1 = _FakeCASTable()
+        table2 = _FakeCASTable()
+        model = _FakeModel(table1, dict())
+        conn1 = _FakeConnection()
+        conn2 = _FakeConnection()
 
         with ResourceManager() as mgr:
 
@@ -218,31 +221,30 @@ class TestResourceManager(tm.TestCase):
             mgr.track_connection(conn1)
             mgr.track_connection(conn2)
 
-            self.assertEqual(mgr.tables, [table1, table2])
-            self.assertEqual(mgr.models, [model])
-            self.assertEqual(mgr.connections, [conn1, conn2])
+            self.assertEqual(len(mgr.tables), 2)
+            self.assertIs(mgr.tables[0], table1)
+            self.assertIs(mgr.tables[1], table2)
+            self.assertEqual(len(mgr.models), 1)
+            self.assertIs(mgr.models[0], model)
+            self.assertEqual(len(mgr.connections), 2)
+            self.assertIs(mgr.connections[0], conn1)
+            self.assertIs(mgr.connections[1], conn2)
 
         self.assertEqual(mgr.tables, [])
         self.assertEqual(mgr.models, [])
         self.assertEqual(mgr.connections, [])
 
     def test_emancipate(self):
-        class CASTable(object):
-            pass
-
-        table1 = CASTable()
-        table2 = CASTable()
+        table1 = _FakeCASTable()
+        table2 = _FakeCASTable()
 
         with ResourceManager() as mgr:
             out = mgr.emancipate(table1, table2) 
             self.assertEqual(out, [table1, table2])
 
     def test_parallelizable(self):
-        class CASTable(object):
-            pass
-
-        table1 = CASTable()
-        table2 = CASTable()
+        table1 = _FakeCASTable()
+        table2 = _FakeCASTable()
 
         with ResourceManager() as mgr:
             out = mgr.is_parallelizable(table1, table2)    
@@ -253,17 +255,12 @@ class TestResourceManager(tm.TestCase):
             with ResourceManager() as mgr:
                 mgr.split_data('foo')
 
-    def test_unload_data(self):
-        with ResourceManager() as mgr:
-            self.assertTrue(mgr.unload_data('foo') is None)
-
-    def test_unload_model(self):
-        with ResourceManager() as mgr:
-            self.assertTrue(mgr.unload_model('foo') is None)
-
-    def test_terminate_connection(self):
+    def test_resource_stubs(self):
         with ResourceManager() as mgr:
-            self.assertTrue(mgr.terminate_connection('foo') is None)
+            for method, arg in [('unload_data', 'foo'),
+                                ('unload_model', 'foo'),
+                                ('terminate_connection', 'foo')]:
+                self.assertIsNone(getattr(mgr, method)(arg), msg=method)
 
 
 if __name__ == '__main__':
@@ -23,18 +23,177 @@ Tests for parameter management
 
 from __future__ import print_function, division, absolute_import, unicode_literals
 
+import ast
+import copy
 import functools
 import os
+import pickle
 import re
 import six
+from six import StringIO
 import swat.utils.testing as tm
 import unittest
+import warnings
 from pipefitter.utils.params import (ParameterManager, check_int, check_float,
                                      check_string, check_url, check_boolean, check_url,
                                      check_variable, check_variable_list, check_number,
                                      check_int_list, check_float_list, check_number_list,
                                      Parameter, param_property, param_def,
                                      READ_ONLY_PARAMETER)
+from pipefitter.utils.connection import ConnectionManager
+
+if six.PY2:
+    def _strip_u(text):
+        ''' Remove Python 2 unicode prefixes from string reprs '''
+        return text.replace("u'", "'")
+else:
+    def _strip_u(text):
+        return text
+
+
+_BASE_DEFS = dict(
+    int_param=param_def(1, check_int, 'Integer parameter'),
+    float_param=param_def(12.34, check_float, 'Float parameter'),
+    str_param=param_def('some text', check_string, 'String parameter'),
+)
+
+
+class MyPM(ParameterManager):
+    param_defs = _BASE_DEFS
+
+
+class MyURLPM(ParameterManager):
+    param_defs = dict(
+        int_param=param_def(2, check_int, 'Integer parameter'),
+        url_param=param_def('http://www.sas.com', check_url, 'URL parameter'),
+    )
+
+
+class BoolPM(ParameterManager):
+    param_defs = dict(
+        bool_param=param_def(True, check_boolean, 'Boolean parameter'),
+    )
+
+
+class URLPM(ParameterManager):
+    param_defs = dict(
+        url_param=param_def('http://www.sas.com', check_url, 'URL parameter'),
+    )
+
+
+class ComparePM(ParameterManager):
+    param_defs = dict(
+        int_one=param_def(100, check_int, 'Integer parameter'),
+        int_two=param_def(200, check_int, 'Integer parameter'),
+        int_minus_one=param_def(99, check_int, 'Integer parameter'),
+        int_plus_one=param_def(101, check_int, 'Integer parameter'),
+    )
+
+
+class OperandPM(ParameterManager):
+    param_defs = dict(
+        int_one=param_def(1, check_int, 'Integer parameter'),
+        int_two=param_def(2, check_int, 'Integer parameter'),
+    )
+
+
+class InplacePM(ParameterManager):
+    param_defs = dict(
+        int_one=param_def(1, check_int, 'Integer parameter'),
+        float_one=param_def(1, check_float, 'Float parameter'),
+    )
+
+
+class ReflectedPM(ParameterManager):
+    param_defs = dict(
+        int_one=param_def(1, check_int, 'Integer parameter'),
+        int_two=param_def(2, check_int, 'Integer parameter'),
+        float_one=param_def(2.5, check_float, 'Float parameter'),
+    )
+
+
+class IntListPM(ParameterManager):
+    param_defs = dict(
+        int_list=param_def(1,
+                           functools.partial(check_int_list, allow_empty=True),
+                           'Integer list parameter'),
+        other_list=param_def([10, 20, 30],
+                             functools.partial(check_int_list, maximum=50, minimum=0),
+                             'Other integer list parameter'),
+        none_list=param_def(2,
+                            functools.partial(check_int_list, allow_none=True),
+                            'Integer list parameter with None'),
+    )
+
+
+class FloatListPM(ParameterManager):
+    param_defs = dict(
+        float_list=param_def(1.2,
+                           functools.partial(check_float_list, allow_empty=True),
+                           'Float list parameter'),
+        other_list=param_def([10.5, 20.6, 30],
+                             functools.partial(check_float_list, maximum=50, minimum=0),
+                             'Other float list parameter'),
+        none_list=param_def(2.4,
+                            functools.partial(check_float_list, allow_none=True),
+                            'Float list parameter with None'),
+    )
+
+
+class NumberListPM(ParameterManager):
+    param_defs = dict(
+        num_list=param_def(1.2,
+                           functools.partial(check_number_list, allow_empty=True),
+                           'Float list parameter'),
+        other_list=param_def([10.5, 20.6, 30],
+                             functools.partial(check_number_list, maximum=50, minimum=0),
+                             'Other number list parameter'),
+        none_list=param_def(2.4,
+                            functools.partial(check_number_list, allow_none=True),
+                            'Float list parameter with None'),
+    )
+
+
+class IntFloatPM(ParameterManager):
+    param_defs = dict(
+        int_param=param_def(10000, check_int, 'Integer parameter'),
+        float_param=param_def(65, check_float, 'Float parameter'),
+    )
+
+
+class IntFloatExtraPM(ParameterManager):
+    param_defs = dict(
+        int_param=param_def(10000, check_int, 'Integer parameter'),
+        float_param=param_def(65, check_float, 'Float parameter'),
+        different_param=param_def(666, check_float, 'Float parameter'),
+    )
+
+
+# Validators shared by the check_* tests
+_INT_0_100 = functools.partial(check_int, minimum=0, maximum=100)
+_INT_MULT_5 = functools.partial(check_int, multiple_of=5)
+_INT_EXCL = functools.partial(check_int, minimum=0, maximum=100,
+                              exclusive_minimum=True, exclusive_maximum=True)
+_INT_EXCL_NONE = functools.partial(check_int, minimum=0, maximum=100, allow_none=True,
+                                   exclusive_minimum=True, exclusive_maximum=True)
+
+_FLOAT_1_99 = functools.partial(check_float, minimum=1, maximum=99)
+_FLOAT_EXCL = functools.partial(check_float, minimum=1, exclusive_minimum=True,
+                                maximum=99, exclusive_maximum=True)
+_FLOAT_MULT_5 = functools.partial(check_float, multiple_of=5)
+_FLOAT_NONE = functools.partial(check_float, allow_none=True)
+
+_NUM_0_100 = functools.partial(check_number, minimum=0, maximum=100)
+_NUM_MULT_5 = functools.partial(check_number, multiple_of=5)
+_NUM_EXCL = functools.partial(check_number, minimum=0, maximum=100,
+                              exclusive_minimum=True, exclusive_maximum=True)
+_NUM_EXCL_NONE = functools.partial(check_number, minimum=0, maximum=100, allow_none=True,
+                                   exclusive_minimum=True, exclusive_maximum=True)
+
+_STR_LEN_2_4 = functools.partial(check_string, min_length=2, max_length=4)
+
+_VAR_RE = re.compile(r'[A-Za-z]\w*')
+_DIGIT_RE = re.compile(r'\d+')
 
 
 class TestParamProperty(tm.TestCase):
@@ -47,13 +206,6 @@ class TestParamProperty(tm.TestCase):
 class TestParameter(tm.TestCase):
 
     def test_str(self):
-        class MyPM(ParameterManager):
-            param_defs = dict(
-                int_param=param_def(1, check_int, 'Integer parameter'),
-                float_param=param_def(12.34, check_float, 'Float parameter'),
-                str_param=param_def('some text', check_string, 'String parameter'),
-            )
-
         pm = MyPM()
 
         self.assertEqual(str(pm.int_param), '1') 
@@ -62,16 +214,9 @@ class TestParameter(tm.TestCase):
 
         self.assertEqual(repr(pm.int_param), '1') 
         self.assertEqual(repr(pm.float_param), '12.34') 
-        self.assertEqual(repr(pm.str_param).replace("u'", "'"), "'some text'") 
+        self.assertEqual(_strip_u(repr(pm.str_param)), "'some text'") 
 
     def test_get_default(self):
-        class MyPM(ParameterManager):
-            param_defs = dict(
-                int_param=param_def(1, check_int, 'Integer parameter'),
-                float_param=param_def(12.34, check_float, 'Float parameter'),
-                str_param=param_def('some text', check_string, 'String parameter'),
-            )
-
         pm = MyPM()
 
         self.assertEqual(pm.int_param.get_default(), 1)
@@ -82,6 +227,19 @@ class TestParameter(tm.TestCase):
         self.assertEqual(pm.int_param.get_default(), 1)
         self.assertFalse(pm.int_param.is_default())
 
+    def test_copy_subclass(self):
+        class MyParameter(Parameter):
+            __slots__ = ('extra', '__doc__')
+
+        param = MyParameter(None, 'int_param', 1, check_int, 'Integer parameter')
+        param.extra = 'foo'
+        out = param.copy()
+
+        self.assertIs(type(out), MyParameter)
+        self.assertEqual(out.extra, 'foo')
+        self.assertEqual(out.get_value(), 1)
+        self.assertEqual(out.__doc__, 'Integer parameter')
+
 
 class TestParameterManager(tm.TestCase):
 
@@ -96,14 +254,61 @@ class TestParameterManager(tm.TestCase):
         self.assertTrue('int_param' in pm.params)
         self.assertEqual(pm.int_param, 2)
 
-    def test_set_options(self):
-        class MyPM(ParameterManager):
+    def test_connection_mixin(self):
+        class ConnectedPM(MyPM, ConnectionManager):
+            def __init__(self, **kwargs):
+                MyPM.__init__(self, **kwargs)
+                ConnectionManager.__init__(self)
+
+        pm = ConnectedPM(int_param=5)
+        self.assertEqual(pm.int_param, 5)
+
+        conn = StringIO()
+        pm.set_connection(conn)
+        self.assertIs(pm.get_connection(), conn)
+
+    def test_slotted_mixin(self):
+        class SlottedMixin(object):
+            __slots__ = ('extra',)
+
+        class SlottedPM(MyPM, SlottedMixin):
+            pass
+
+        pm = SlottedPM(int_param=5)
+        pm.extra = 'foo'
+        self.assertEqual(pm.int_param, 5)
+        self.assertEqual(pm.extra, 'foo')
+
+    def test_pickle(self):
+        pm = MyPM(int_param=5)
+        for protocol in (0, 2):
+            out = pickle.loads(pickle.dumps(pm, protocol))
+            self.assertEqual(out.params.to_dict(), pm.params.to_dict(),
+                             msg='protocol=%s' % protocol)
+            self.assertIs(out.int_param._owner, out, msg='protocol=%s' % protocol)
+            self.assertEqual(out.int_param.__doc__, pm.int_param.__doc__,
+                             msg='protocol=%s' % protocol)
+
+    def test_param_defs_changed(self):
+        class ChangedPM(ParameterManager):
             param_defs = dict(
                 int_param=param_def(1, check_int, 'Integer parameter'),
-                float_param=param_def(12.34, check_float, 'Float parameter'),
-                str_param=param_def('some text', check_string, 'String parameter'),
+                int_list=param_def([1, 2], check_int_list, 'Integer list parameter'),
             )
 
+        pm = ChangedPM()
+        self.assertEqual(pm.int_param, 1)
+        self.assertEqual(pm.int_list, [1, 2])
+
+        # Definitions changed in place apply to new instances
+        ChangedPM.param_defs['int_param']['default'] = 5
+        ChangedPM.param_defs['int_list']['default'].append(3)
+
+        pm = ChangedPM()
+        self.assertEqual(pm.int_param, 5)
+        self.assertEqual(pm.int_list, [1, 2, 3])
+
+    def test_set_options(self):
         pm = MyPM()
         
         self.assertEqual(pm.int_param._options, 0)
@@ -117,33 +322,23 @@ class TestParameterManager(tm.TestCase):
         self.assertEqual(pm.str_param._options, READ_ONLY_PARAMETER)
 
     def test_str(self):
-        class MyPM(ParameterManager):
-            param_defs = dict(
-                int_param=param_def(1, check_int, 'Integer parameter'),
-                float_param=param_def(12.34, check_float, 'Float parameter'),
-                str_param=param_def('some text', check_string, 'String parameter'),
-            )
-
         pm = MyPM()
 
-        self.assertEqual(str(pm).replace("u'", "'"),
+        self.assertEqual(_strip_u(str(pm)),
                          'MyPM(float_param=12.34, int_param=1, '
                          'str_param=\'some text\')')
 
-        self.assertEqual(repr(pm).replace("u'", "'"),
+        self.assertEqual(_strip_u(repr(pm)),
                          'MyPM(float_param=12.34, int_param=1, '
                          'str_param=\'some text\')')
 
 
 class TestParameterDict(tm.TestCase):
 
+    _PM1_DEFAULT = {'int_param': 1, 'float_param': 12.34, 'str_param': 'some text'}
+    _PM2_DEFAULT = {'int_param': 2, 'url_param': 'http://www.sas.com'}
+
     def setUp(self):
-        class MyPM(ParameterManager):
-            param_defs = dict(
-                int_param=param_def(1, check_int, 'Integer parameter'),
-                float_param=param_def(12.34, check_float, 'Float parameter'),
-                str_param=param_def('some text', check_string, 'String parameter'),
-            )
         self.pm = MyPM()
         self.pd = self.pm.params
 
@@ -151,33 +346,29 @@ class TestParameterDict(tm.TestCase):
         pass
 
     def test_copy(self):
-        import copy
-
         pd2 = copy.copy(self.pd)
 
-        self.assertEqual(sorted(self.pd.items()), sorted(pd2.items())) 
+        self.assertTrue(pd2 is not self.pd)
+        self.assertEqual(self.pd, pd2)
 
     def test_deepcopy(self):
-        import copy
-
         pd2 = copy.deepcopy(self.pd)
 
-        self.assertEqual(sorted(self.pd.items()), sorted(pd2.items())) 
+        self.assertTrue(pd2 is not self.pd)
+        self.assertEqual(self.pd, pd2)
 
     def test_getitem(self):
-        self.assertTrue(self.pd[self.pd.get_parameter('int_param')] is self.pd['int_param'])
-        self.assertEqual(self.pd[self.pd.get_parameter('int_param')], 1)
-        self.assertEqual(self.pd['int_param'], 1)
+        value = self.pd[self.pd.get_parameter('int_param')]
+        self.assertTrue(value is self.pd['int_param'])
+        self.assertEqual(value, 1)
 
     def test_setitem(self):
-        class MyPM(ParameterManager):
-            param_defs = dict(
-                int_param=param_def(1, check_int, 'Integer parameter',
-                                    options=READ_ONLY_PARAMETER),
-                float_param=param_def(12.34, check_float, 'Float parameter'),
-            )
+        class ReadOnlyPM(ParameterManager):
+            param_defs = dict(_BASE_DEFS,
+                              int_param=param_def(1, check_int, 'Integer parameter',
+                                                  options=READ_ONLY_PARAMETER))
 
-        pm = MyPM()
+        pm = ReadOnlyPM()
         pd = pm.params
 
         self.assertEqual(pd['int_param'], 1)
@@ -198,65 +389,53 @@ class TestParameterDict(tm.TestCase):
 
     def test_get_filtered_params(self):
         pm1 = self.pm
-
-        class MyPM2(ParameterManager):
-            param_defs = dict(
-                int_param=param_def(2, check_int, 'Integer parameter'),
-                url_param=param_def('http://www.sas.com', check_url, 'URL parameter'),
-            )
-
-        pm2 = MyPM2()
-
-        # Parameter objects as keys
-
-        params = {pm1.int_param: 100, pm1.str_param: 'more text',
-                  pm2.int_param: 999}
-
-        self.assertEqual(pm1.get_filtered_params(params),
-                         {'int_param': 100, 'float_param': 12.34, 'str_param': 'more text'})
-        self.assertEqual(pm1.params,
-                         {'int_param': 1, 'float_param': 12.34, 'str_param': 'some text'})
-        self.assertEqual(pm2.get_filtered_params(params),
-                         {'int_param': 999, 'url_param': 'http://www.sas.com'})
-        self.assertEqual(pm2.params,
-                         {'int_param': 2, 'url_param': 'http://www.sas.com'})
-
-        # Strings as keys
-
-        params = {'int_param': 12345, 'float_param': 6.66}
-
-        self.assertEqual(pm1.get_filtered_params(params),
-                         {'int_param': 12345, 'float_param': 6.66, 'str_param': 'some text'})
-        self.assertEqual(pm1.params,
-                         {'int_param': 1, 'float_param': 12.34, 'str_param': 'some text'})
-        self.assertEqual(pm2.get_filtered_params(params),
-                         {'int_param': 12345, 'url_param': 'http://www.sas.com'})
-        self.assertEqual(pm2.params,
-                         {'int_param': 2, 'url_param': 'http://www.sas.com'})
-
-        # ParameterManager object arguments
-
-        self.assertEqual(pm1.get_filtered_params(pm2),
-                         {'int_param': 1, 'float_param': 12.34, 'str_param': 'some text'})
-        self.assertEqual(pm1.params,
-                         {'int_param': 1, 'float_param': 12.34, 'str_param': 'some text'})
-        self.assertEqual(pm2.params,
-                         {'int_param': 2, 'url_param': 'http://www.sas.com'})
-
-        # Parameter object arguments
-
-        args = (pm1.int_param, 100, pm2.int_param, 300)
-
-        self.assertEqual(pm1.get_filtered_params(*args),
-                         {'int_param': 100, 'float_param': 12.34, 'str_param': 'some text'})
-        self.assertEqual(pm2.get_filtered_params(*args),
-                         {'int_param': 300, 'url_param': 'http://www.sas.com'})
-        self.assertEqual(pm1.params,
-                         {'int_param': 1, 'float_param': 12.34, 'str_param': 'some text'})
-        self.assertEqual(pm2.params,
-                         {'int_param': 2, 'url_param': 'http://www.sas.com'})
-
-        # Tuple arguments
+        pm2 = MyURLPM()
+        i1, s1, i2 = pm1.int_param, pm1.str_param, pm2.int_param
+
+        # Each case is (arguments, expected for pm1, expected for pm2)
+        cases = [
+            # Parameter objects as keys
+            (({i1: 100, s1: 'more text', i2: 999},),
+             dict(self._PM1_DEFAULT, int_param=100, str_param='more text'),
+             dict(self._PM2_DEFAULT, int_param=999)),
+
+            # Strings as keys
+            (({'int_param': 12345, 'float_param': 6.66},),
+             dict(self._PM1_DEFAULT, int_param=12345, float_param=6.66),
+             dict(self._PM2_DEFAULT, int_param=12345)),
+
+            # ParameterManager object arguments
+            ((pm2,),
+             self._PM1_DEFAULT,
+             None),
+
+            # Parameter object arguments
+            ((i1, 100, i2, 300),
+             dict(self._PM1_DEFAULT, int_param=100),
+             dict(self._PM2_DEFAULT, int_param=300)),
+
+            # Tuple arguments
+            (((i1, 200), ('float_param', 99.9), (i2, 300)),
+             dict(self._PM1_DEFAULT, int_param=200, float_param=99.9),
+             dict(self._PM2_DEFAULT, int_param=300)),
+
+            # Consecutive arguments
+            (('int_param', 200, 'float_param', 99.9),
+             dict(self._PM1_DEFAULT, int_param=200, float_param=99.9),
+             None),
+        ]
+
+        for args, pm1_expected, pm2_expected in cases:
+            msg = 'args=%r' % (args,)
+            self.assertEqual(pm1.get_filtered_params(*args), pm1_expected, msg=msg)
+            if pm2_expected is not None:
+                self.assertEqual(pm2.get_filtered_params(*args), pm2_expected, msg=msg)
+            self.assertEqual(pm1.params,
+                             self._PM1_DEFAULT, msg=msg)
+            self.assertEqual(pm2.params,
+                             self._PM2_DEFAULT, msg=msg)
+
+        # Bad tuple arguments
 
         with self.assertRaises(ValueError):
             pm1.get_filtered_params(('int_param',))
@@ -264,84 +443,76 @@ class TestParameterDict(tm.TestCase):
         with self.assertRaises(ValueError):
             pm1.get_filtered_params(('int_param', 100, 200))
 
-        args = ((pm1.int_param, 200), ('float_param', 99.9), (pm2.int_param, 300))
-
-        self.assertEqual(pm1.get_filtered_params(*args),
-                         {'int_param': 200, 'float_param': 99.9, 'str_param': 'some text'})
-        self.assertEqual(pm2.get_filtered_params(*args),
-                         {'int_param': 300, 'url_param': 'http://www.sas.com'})
-        self.assertEqual(pm1.params,
-                         {'int_param': 1, 'float_param': 12.34, 'str_param': 'some text'})
-        self.assertEqual(pm2.params,
-                         {'int_param': 2, 'url_param': 'http://www.sas.com'})
-
-        # Consecutive arguments
+        # Bad consecutive arguments
 
         with self.assertRaises(ValueError):
             pm1.get_filtered_params('int_param')
 
         with self.assertRaises(TypeError):
             pm1.get_filtered_params(10)
-        
-        args = ('int_param', 200, 'float_param', 99.9)
-
-        self.assertEqual(pm1.get_filtered_params(*args),
-                         {'int_param': 200, 'float_param': 99.9, 'str_param': 'some text'})
-        self.assertEqual(pm1.params,
-                         {'int_param': 1, 'float_param': 12.34, 'str_param': 'some text'})
 
     def test_get_combined_params(self):
         pm1 = self.pm
-
-        class MyPM2(ParameterManager):
-            param_defs = dict(
-                int_param=param_def(2, check_int, 'Integer parameter'),
-                url_param=param_def('http://www.sas.com', check_url, 'URL parameter'),
-            )
-
-        pm2 = MyPM2()
-
-        # Parameter objects as keys
-
-        params = {pm1.int_param: 100, pm1.str_param: 'more text'}
-
-        self.assertEqual(pm1.get_combined_params(params),
-                         {'int_param': 100, 'float_param': 12.34, 'str_param': 'more text'})
-        self.assertEqual(pm1.params,
-                         {'int_param': 1, 'float_param': 12.34, 'str_param': 'some text'})
-        with self.assertRaises(KeyError):
-            pm2.get_combined_params(params),
-
-        # Strings as keys
-
-        params = {'int_param': 12345, 'float_param': 6.66}
-
-        self.assertEqual(pm1.get_combined_params(params),
-                         {'int_param': 12345, 'float_param': 6.66, 'str_param': 'some text'})
-        self.assertEqual(pm1.params,
-                         {'int_param': 1, 'float_param': 12.34, 'str_param': 'some text'})
-        with self.assertRaises(KeyError):
-            pm2.get_combined_params(params)
+        pm2 = MyURLPM()
+        i1, s1 = pm1.int_param, pm1.str_param
+
+        # Each case is (arguments, expected for pm1, expected for pm2)
+        cases = [
+            # Parameter objects as keys
+            (({i1: 100, s1: 'more text'},),
+             dict(self._PM1_DEFAULT, int_param=100, str_param='more text'),
+             None),
+
+            # Strings as keys
+            (({'int_param': 12345, 'float_param': 6.66},),
+             dict(self._PM1_DEFAULT, int_param=12345, float_param=6.66),
+             None),
+
+            # Parameter object arguments
+            ((i1, 100),
+             dict(self._PM1_DEFAULT, int_param=100),
+             dict(self._PM2_DEFAULT, int_param=100)),
+
+            # Tuple arguments
+            (((i1, 200), ('float_param', 99.9)),
+             dict(self._PM1_DEFAULT, int_param=200, float_param=99.9),
+             None),
+
+            # Consecutive arguments
+            (('int_param', 200, 'float_param', 99.9),
+             dict(self._PM1_DEFAULT, int_param=200, float_param=99.9),
+             None),
+        ]
+
+        for args, pm1_expected, pm2_expected in cases:
+            msg = 'args=%r' % (args,)
+            self.assertEqual(pm1.get_combined_params(*args), pm1_expected, msg=msg)
+            if pm2_expected is not None:
+                self.assertEqual(pm2.get_combined_params(*args), pm2_expected, msg=msg)
+            self.assertEqual(pm1.params,
+                             self._PM1_DEFAULT, msg=msg)
+            self.assertEqual(pm2.params,
+                             self._PM2_DEFAULT, msg=msg)
+
+        # Arguments containing parameters that pm2 doesn't have
+        key_error_cases = [
+            ({i1: 100, s1: 'more text'},),
+            ({'int_param': 12345, 'float_param': 6.66},),
+            ((i1, 200), ('float_param', 99.9)),
+        ]
+
+        for args in key_error_cases:
+            with self.assertRaises(KeyError):
+                pm2.get_combined_params(*args)
+            self.assertEqual(pm2.params,
+                             self._PM2_DEFAULT, msg='args=%r' % (args,))
 
         # ParameterManager object arguments
 
         with self.assertRaises(TypeError):
             pm1.get_combined_params(pm2)
 
-        # Parameter object arguments
-
-        args = (pm1.int_param, 100)
-
-        self.assertEqual(pm1.get_combined_params(*args),
-                         {'int_param': 100, 'float_param': 12.34, 'str_param': 'some text'})
-        self.assertEqual(pm2.get_combined_params(*args),
-                         {'int_param': 100, 'url_param': 'http://www.sas.com'})
-        self.assertEqual(pm1.params,
-                         {'int_param': 1, 'float_param': 12.34, 'str_param': 'some text'})
-        self.assertEqual(pm2.params,
-                         {'int_param': 2, 'url_param': 'http://www.sas.com'})
-
-        # Tuple arguments
+        # Bad tuple arguments
 
         with self.assertRaises(ValueError):
             pm1.get_combined_params(('int_param',))
@@ -349,47 +520,26 @@ class TestParameterDict(tm.TestCase):
         with self.assertRaises(ValueError):
             pm1.get_combined_params(('int_param', 100, 200))
 
-        args = ((pm1.int_param, 200), ('float_param', 99.9))
-
-        self.assertEqual(pm1.get_combined_params(*args),
-                         {'int_param': 200, 'float_param': 99.9, 'str_param': 'some text'})
-        self.assertEqual(pm1.params,
-                         {'int_param': 1, 'float_param': 12.34, 'str_param': 'some text'})
-        with self.assertRaises(KeyError):
-            pm2.get_combined_params(*args)
-
-        # Bad tuple argument
-
-        args = ((100, 200),)
-
         with self.assertRaises(TypeError):
-            pm1.get_combined_params(*args)
+            pm1.get_combined_params((100, 200))
 
-        # Consecutive arguments
+        # Bad consecutive arguments
 
         with self.assertRaises(ValueError):
             pm1.get_combined_params('int_param')
 
         with self.assertRaises(TypeError):
             pm1.get_combined_params(10)
-
-        args = ('int_param', 200, 'float_param', 99.9)
-
-        self.assertEqual(pm1.get_combined_params(*args),
-                         {'int_param': 200, 'float_param': 99.9, 'str_param': 'some text'})
-        self.assertEqual(pm1.params,
-                         {'int_param': 1, 'float_param': 12.34, 'str_param': 'some text'})
         
-    def test_str(self):
-        self.assertEqual(self.pd, eval(str(self.pd)))
-
-    def test_repr(self):
-        self.assertEqual(self.pd, eval(str(self.pd)))
+    def test_str_and_repr(self):
+        out = str(self.pd)
+        self.assertEqual(self.pd, ast.literal_eval(out))
+        self.assertEqual(repr(self.pd), out)
 
     def test_del_parameter(self):
         pd = self.pd
 
-        self.assertEqual(pd, {'int_param': 1, 'float_param': 12.34, 'str_param': 'some text'})
+        self.assertEqual(pd, self._PM1_DEFAULT)
 
         pd.del_parameter('str_param')
         self.assertEqual(pd, {'int_param': 1, 'float_param': 12.34})
@@ -430,18 +580,18 @@ class TestParameterDict(tm.TestCase):
 
     def test_describe_parameter(self):
         pd = self.pd
-        output = six.StringIO()
+        output = StringIO()
 
         pd.describe_parameter('int_param', output=output)
         output.seek(0)
         self.assertEqual(output.read(),
             'int_param\n    Integer parameter\n    [Current: 1] [Default: 1]')
 
-        output = six.StringIO()
+        output = StringIO()
 
         pd.describe_parameter('int_param', 'str_param', output=output)
         output.seek(0)
-        self.assertEqual(output.read().replace("u'", "'"),
+        self.assertEqual(_strip_u(output.read()),
             'int_param\n    Integer parameter\n    [Current: 1] [Default: 1]\n\n'
             'str_param\n    String parameter\n    [Current: \'some text\'] [Default: \'some text\']')
 
@@ -460,10 +610,10 @@ class TestParameterDict(tm.TestCase):
     def test_update(self):
         pd = self.pd
 
-        self.assertEqual(pd, {'int_param': 1, 'float_param': 12.34, 'str_param': 'some text'})
+        self.assertEqual(pd, self._PM1_DEFAULT)
         
         pd.update({self.pm.int_param: 200, self.pm.str_param: 'hi'})
-        self.assertEqual(pd, {'int_param': 200, 'float_param': 12.34, 'str_param': 'hi'})
+        self.assertEqual(pd, dict(self._PM1_DEFAULT, int_param=200, str_param='hi'))
 
         class MyPM2(ParameterManager):
             param_defs = dict(
@@ -482,18 +632,19 @@ class TestParameterDict(tm.TestCase):
 class TestParameters(tm.TestCase):
 
     def setUp(self):
-        class MyPM(ParameterManager):
-            param_defs = dict(
-                int_param=param_def(1, check_int, 'Integer parameter'),
-                float_param=param_def(12.34, check_float, 'Float parameter'),
-                str_param=param_def('some text', check_string, 'String parameter'),
-            )
-
         self.pm = MyPM()
 
     def tearDown(self):
         pass
 
+    def _assert_params(self, pm, int_param, float_param, str_param):
+        self.assertEqual((pm.int_param, pm.float_param, pm.str_param),
+                         (int_param, float_param, str_param))
+
+    def _assert_invalid(self, obj, attr, value, exc=ValueError):
+        with self.assertRaises(exc):
+            setattr(obj, attr, value)
+
     def test_values(self):
         pm = self.pm
 
@@ -506,14 +657,11 @@ class TestParameters(tm.TestCase):
         self.assertEqual(pm.params, {pm.int_param: 1, pm.float_param: 12.34,
                                      pm.str_param: 'some text'}) 
 
-        class MyPM2(ParameterManager):
-            param_defs = dict(
-                int_param=param_def(1, check_int, 'Integer parameter'),
-                float_param=param_def(12.34, check_float, 'Float parameter'),
-                str_param=param_def('some text', check_string, 'String parameter'),
-            )
+        # Parameter and string keys for the same name collapse into one
+        self.assertEqual(pm.params, {pm.int_param: 1, 'int_param': 1,
+                                     pm.float_param: 12.34, 'str_param': 'some text'})
 
-        pm2 = MyPM2()
+        pm2 = MyPM()
 
         self.assertEqual(pm2.params, pm.params)
 
@@ -530,7 +678,7 @@ class TestParameters(tm.TestCase):
     def test_check_int(self):
         class IntParam(ParameterManager):
             param_defs = dict(
-                int_param=param_def(1, functools.partial(check_int, minimum=0, maximum=100),
+                int_param=param_def(1, _INT_0_100,
                                    'Integer parameter'),
             )
 
@@ -538,8 +686,7 @@ class TestParameters(tm.TestCase):
 
         # Incorrect types
 
-        with self.assertRaises(ValueError):
-            pm.int_param = 'foo'
+        self._assert_invalid(pm, 'int_param', 'foo')
 
         # Range values for integers
 
@@ -552,15 +699,13 @@ class TestParameters(tm.TestCase):
         pm.int_param = 100
         self.assertEqual(pm.int_param, 100)
 
-        with self.assertRaises(ValueError):
-            pm.int_param = -1
+        self._assert_invalid(pm, 'int_param', -1)
 
-        with self.assertRaises(ValueError):
-            pm.int_param = 101
+        self._assert_invalid(pm, 'int_param', 101)
 
         class IntParam2(ParameterManager):
             param_defs = dict(
-                int_param=param_def(10, functools.partial(check_int, multiple_of=5),
+                int_param=param_def(10, _INT_MULT_5,
                                    'Integer parameter'),
             )
 
@@ -569,17 +714,13 @@ class TestParameters(tm.TestCase):
         pm.int_param = 20
         self.assertEqual(pm.int_param, 20)
 
-        with self.assertRaises(ValueError):
-            pm.int_param = 23
+        self._assert_invalid(pm, 'int_param', 23)
 
         # Exclusive min / max
 
         class IntParam3(ParameterManager):
             param_defs = dict(
-                int_param=param_def(1, functools.partial(check_int, minimum=0,
-                                                         maximum=100,
-                                                         exclusive_minimum=True,
-                                                         exclusive_maximum=True),
+                int_param=param_def(1, _INT_EXCL,
                                    'Integer parameter'),
             )
 
@@ -591,24 +732,17 @@ class TestParameters(tm.TestCase):
         pm.int_param = 99
         self.assertEqual(pm.int_param, 99)
 
-        with self.assertRaises(ValueError):
-            pm.int_param = 0
+        self._assert_invalid(pm, 'int_param', 0)
 
-        with self.assertRaises(ValueError):
-            pm.int_param = 100
+        self._assert_invalid(pm, 'int_param', 100)
 
         # None value
 
-        with self.assertRaises(TypeError):
-            pm.int_param = None
+        self._assert_invalid(pm, 'int_param', None, TypeError)
 
         class IntParam4(ParameterManager):
             param_defs = dict(
-                int_param=param_def(1, functools.partial(check_int, minimum=0,
-                                                         maximum=100,
-                                                         allow_none=True,
-                                                         exclusive_minimum=True,
-                                                         exclusive_maximum=True),
+                int_param=param_def(1, _INT_EXCL_NONE,
                                    'Integer parameter'),
             )
 
@@ -621,7 +755,7 @@ class TestParameters(tm.TestCase):
         class FloatPM(ParameterManager):
             param_defs = dict(
                 float_param=param_def(12.34,
-                                      functools.partial(check_float, minimum=1, maximum=99),
+                                      _FLOAT_1_99,
                                      'Float parameter'),
             )
 
@@ -629,8 +763,7 @@ class TestParameters(tm.TestCase):
 
         # Incorrect types
 
-        with self.assertRaises(ValueError):
-            pm.float_param = 'foo'
+        self._assert_invalid(pm, 'float_param', 'foo')
 
         # Range values for floats
 
@@ -643,33 +776,27 @@ class TestParameters(tm.TestCase):
         pm.float_param = 99.0
         self.assertEqual(pm.float_param, 99)
 
-        with self.assertRaises(ValueError):
-            pm.float_param = 0.9
+        self._assert_invalid(pm, 'float_param', 0.9)
 
-        with self.assertRaises(ValueError):
-            pm.float_param = 99.1
+        self._assert_invalid(pm, 'float_param', 99.1)
 
         class FloatPM2(ParameterManager):
             param_defs = dict(
-                float_param=param_def(12.34, functools.partial(check_float,
-                                                     minimum=1, exclusive_minimum=True,
-                                                     maximum=99, exclusive_maximum=True),
+                float_param=param_def(12.34, _FLOAT_EXCL,
                                      'Float parameter'),
             )
 
         pm = FloatPM2()
 
-        with self.assertRaises(ValueError):
-            pm.float_param = 1
+        self._assert_invalid(pm, 'float_param', 1)
 
-        with self.assertRaises(ValueError):
-            pm.float_param = 99 
+        self._assert_invalid(pm, 'float_param', 99)
 
         # Multiples
 
         class FloatPM3(ParameterManager):
             param_defs = dict(
-                float_param=param_def(10.0, functools.partial(check_float, multiple_of=5),
+                float_param=param_def(10.0, _FLOAT_MULT_5,
                                      'Float parameter'),
             )
 
@@ -678,17 +805,15 @@ class TestParameters(tm.TestCase):
         pm.float_param = 25.0
         self.assertEqual(pm.float_param, 25)
 
-        with self.assertRaises(ValueError):
-            pm.float_param = 23.0
+        self._assert_invalid(pm, 'float_param', 23.0)
 
         # None value
 
-        with self.assertRaises(TypeError):
-            pm.float_param = None
+        self._assert_invalid(pm, 'float_param', None, TypeError)
 
         class FloatPM4(ParameterManager):
             param_defs = dict(
-                float_param=param_def(10.0, functools.partial(check_float, allow_none=True),
+                float_param=param_def(10.0, _FLOAT_NONE,
                                      'Float parameter'),
             )
 
@@ -700,7 +825,7 @@ class TestParameters(tm.TestCase):
     def test_check_number(self):
         class NumParam(ParameterManager):
             param_defs = dict(
-                num_param=param_def(1, functools.partial(check_number, minimum=0, maximum=100),
+                num_param=param_def(1, _NUM_0_100,
                                    'Number parameter'),
             )
 
@@ -708,8 +833,7 @@ class TestParameters(tm.TestCase):
 
         # Incorrect types
 
-        with self.assertRaises(ValueError):
-            pm.num_param = 'foo'
+        self._assert_invalid(pm, 'num_param', 'foo')
 
         # Range values for integers
 
@@ -722,11 +846,9 @@ class TestParameters(tm.TestCase):
         pm.num_param = 100
         self.assertEqual(pm.num_param, 100)
 
-        with self.assertRaises(ValueError):
-            pm.num_param = -1
+        self._assert_invalid(pm, 'num_param', -1)
 
-        with self.assertRaises(ValueError):
-            pm.num_param = 101
+        self._assert_invalid(pm, 'num_param', 101)
 
         # Values for floats
 
@@ -737,7 +859,7 @@ class TestParameters(tm.TestCase):
 
         class NumParam2(ParameterManager):
             param_defs = dict(
-                num_param=param_def(10, functools.partial(check_number, multiple_of=5),
+                num_param=param_def(10, _NUM_MULT_5,
                                    'Number parameter'),
             )
 
@@ -746,17 +868,13 @@ class TestParameters(tm.TestCase):
         pm.num_param = 20
         self.assertEqual(pm.num_param, 20)
 
-        with self.assertRaises(ValueError):
-            pm.num_param = 23
+        self._assert_invalid(pm, 'num_param', 23)
 
         # Exclusive min / max
 
         class NumParam3(ParameterManager):
             param_defs = dict(
-                num_param=param_def(1, functools.partial(check_number, minimum=0,
-                                                         maximum=100,
-                                                         exclusive_minimum=True,
-                                                         exclusive_maximum=True),
+                num_param=param_def(1, _NUM_EXCL,
                                    'Number parameter'),
             )
 
@@ -768,24 +886,17 @@ class TestParameters(tm.TestCase):
         pm.num_param = 99
         self.assertEqual(pm.num_param, 99)
 
-        with self.assertRaises(ValueError):
-            pm.num_param = 0
+        self._assert_invalid(pm, 'num_param', 0)
 
-        with self.assertRaises(ValueError):
-            pm.num_param = 100
+        self._assert_invalid(pm, 'num_param', 100)
 
         # None value
 
-        with self.assertRaises(TypeError):
-            pm.num_param = None
+        self._assert_invalid(pm, 'num_param', None, TypeError)
 
         class NumParam4(ParameterManager):
             param_defs = dict(
-                num_param=param_def(1, functools.partial(check_number, minimum=0,
-                                                         maximum=100,
-                                                         allow_none=True,
-                                                         exclusive_minimum=True,
-                                                         exclusive_maximum=True),
+                num_param=param_def(1, _NUM_EXCL_NONE,
                                    'Number parameter'),
             )
 
@@ -809,7 +920,7 @@ class TestParameters(tm.TestCase):
                                                          normalize=True),
                                        'Select parameter'),
                 regex_param=param_def('abc1',
-                                      functools.partial(check_string, pattern=re.compile(r'\d+')),
+                                      functools.partial(check_string, pattern=_DIGIT_RE),
                                       'Regex parameter'),
             )
 
@@ -817,22 +928,19 @@ class TestParameters(tm.TestCase):
 
         # Incorrect types
 
-        with self.assertRaises(TypeError):
-            pm.str_param = 100
+        self._assert_invalid(pm, 'str_param', 100, TypeError)
 
         # String patterns
 
         pm.str_param = 'even more text'
         self.assertEqual(pm.str_param, 'even more text')
 
-        with self.assertRaises(ValueError):
-            pm.str_param = 'foo'
+        self._assert_invalid(pm, 'str_param', 'foo')
 
         pm.regex_param = 'even 2 text'
         self.assertEqual(pm.regex_param, 'even 2 text')
 
-        with self.assertRaises(ValueError):
-            pm.regex_param = 'even text'
+        self._assert_invalid(pm, 'regex_param', 'even text')
 
         # String selection
 
@@ -845,25 +953,22 @@ class TestParameters(tm.TestCase):
         pm.select_param = 'TwO'
         self.assertEqual(pm.select_param, 'two')
 
-        with self.assertRaises(ValueError):
-            pm.select_param = 'foo'
+        self._assert_invalid(pm, 'select_param', 'foo')
 
         # Min / max lengths
 
         class StringPM2(ParameterManager):
             param_defs = dict(
                 str_param=param_def('text',
-                                    functools.partial(check_string, min_length=2, max_length=4),
+                                    _STR_LEN_2_4,
                                     'String parameter'),
             )
 
         pm = StringPM2()
 
-        with self.assertRaises(ValueError):
-            pm.str_param = 'foobar'
+        self._assert_invalid(pm, 'str_param', 'foobar')
 
-        with self.assertRaises(ValueError):
-            pm.str_param = 'f'
+        self._assert_invalid(pm, 'str_param', 'f')
 
         pm.str_param = 'foo'
         self.assertEqual(pm.str_param, 'foo')
@@ -872,7 +977,7 @@ class TestParameters(tm.TestCase):
         class VarPM(ParameterManager):
             param_defs = dict(
                 var_param=param_def('varname',
-                                    functools.partial(check_variable, pattern=r'[A-Za-z]\w*',
+                                    functools.partial(check_variable, pattern=_VAR_RE,
                                                       allow_none=False))
             )
 
@@ -881,16 +986,13 @@ class TestParameters(tm.TestCase):
         pm.var_param = 'foo'
         self.assertEqual(pm.var_param, 'foo')
 
-        with self.assertRaises(ValueError):
-            pm.var_param = '6'
+        self._assert_invalid(pm, 'var_param', '6')
         self.assertEqual(pm.var_param, 'foo')
 
-        with self.assertRaises(TypeError):
-            pm.var_param = 6
+        self._assert_invalid(pm, 'var_param', 6, TypeError)
         self.assertEqual(pm.var_param, 'foo')
 
-        with self.assertRaises(TypeError):
-            pm.var_param = None
+        self._assert_invalid(pm, 'var_param', None, TypeError)
         self.assertEqual(pm.var_param, 'foo')
 
     def test_check_variable_list(self):
@@ -898,7 +1000,7 @@ class TestParameters(tm.TestCase):
             param_defs = dict(
                 var_param=param_def('varname',
                                     functools.partial(check_variable_list,
-                                                      pattern=r'[A-Za-z]\w*',
+                                                      pattern=_VAR_RE,
                                                       allow_empty=False))
             )
 
@@ -910,32 +1012,22 @@ class TestParameters(tm.TestCase):
         pm.var_param = ['one', 'two']
         self.assertEqual(pm.var_param, ['one', 'two'])
 
-        with self.assertRaises(ValueError):
-            pm.var_param = '6'
+        self._assert_invalid(pm, 'var_param', '6')
         self.assertEqual(pm.var_param, ['one', 'two'])
 
-        with self.assertRaises(TypeError):
-            pm.var_param = 6
+        self._assert_invalid(pm, 'var_param', 6, TypeError)
         self.assertEqual(pm.var_param, ['one', 'two'])
 
-        with self.assertRaises(ValueError):
-            pm.var_param = None
+        self._assert_invalid(pm, 'var_param', None)
         self.assertEqual(pm.var_param, ['one', 'two'])
 
-        with self.assertRaises(ValueError):
-            pm.var_param = []
+        self._assert_invalid(pm, 'var_param', [])
         self.assertEqual(pm.var_param, ['one', 'two'])
 
     def test_check_boolean(self):
-        class BoolPM(ParameterManager):
-            param_defs = dict(
-                bool_param=param_def(True, check_boolean, 'Boolean parameter'),
-            )
-
         pm = BoolPM()
 
-        with self.assertRaises(TypeError):
-            pm.bool_param = 'foo'
+        self._assert_invalid(pm, 'bool_param', 'foo', TypeError)
 
         pm.bool_param = False
         self.assertEqual(pm.bool_param, False)
@@ -946,19 +1038,12 @@ class TestParameters(tm.TestCase):
         pm.bool_param = 0
         self.assertEqual(pm.bool_param, False)
 
-        with self.assertRaises(ValueError):
-            pm.bool_param = 100
+        self._assert_invalid(pm, 'bool_param', 100)
 
     def test_check_url(self):
-        class URLPM(ParameterManager):
-            param_defs = dict(
-                url_param=param_def('http://www.sas.com', check_url, 'URL parameter'),
-            )
-
         pm = URLPM()
 
-        with self.assertRaises(TypeError):
-            pm.url_param = 100
+        self._assert_invalid(pm, 'url_param', 100, TypeError)
 
         pm.url_param = 'http://www.google.com'
         self.assertEqual(pm.url_param, 'http://www.google.com')
@@ -971,12 +1056,10 @@ class TestParameters(tm.TestCase):
         pm = self.pm
 
         pm.params.update({pm.int_param: 20, pm.float_param: 999.99})
-        self.assertEqual(pm.params, {'int_param': 20, 'float_param': 999.99,
-                                      'str_param': 'some text'}) 
+        self._assert_params(pm, 20, 999.99, 'some text')
 
         pm.params.update({'int_param': 55, 'float_param': 1.896})
-        self.assertEqual(pm.params, {'int_param': 55, 'float_param': 1.896,
-                                      'str_param': 'some text'}) 
+        self._assert_params(pm, 55, 1.896, 'some text')
 
     def test_param_ids(self):
         self.assertEqual(len(Parameter.param_ids), 3)
@@ -999,12 +1082,15 @@ class TestParameters(tm.TestCase):
         pm = self.pm
 
         pm.params.update({pm.int_param: 20, pm.float_param: 999.99})
-        self.assertEqual(pm.params, {'int_param': 20, 'float_param': 999.99,
-                                      'str_param': 'some text'}) 
+        self._assert_params(pm, 20, 999.99, 'some text')
 
         pm.params.update({'int_param': 55, 'float_param': 1.896})
-        self.assertEqual(pm.params, {'int_param': 55, 'float_param': 1.896,
-                                      'str_param': 'some text'}) 
+        self._assert_params(pm, 55, 1.896, 'some text')
+
+        # A bad value leaves the parameters untouched
+        with self.assertRaises(ValueError):
+            pm.params.update(('int_param', 10), ('float_param', 'foo'))
+        self._assert_params(pm, 55, 1.896, 'some text')
 
     def test_param_ids(self):
 #       self.assertEqual(Parameter.param_ids['int_param'], '10000')
@@ -1030,15 +1116,7 @@ class TestParameters(tm.TestCase):
     def test_comparisons(self):
         pm = self.pm
 
-        class MyPM2(ParameterManager):
-            param_defs = dict(
-                int_one=param_def(100, check_int, 'Integer parameter'),
-                int_two=param_def(200, check_int, 'Integer parameter'),
-                int_minus_one=param_def(99, check_int, 'Integer parameter'),
-                int_plus_one=param_def(101, check_int, 'Integer parameter'),
-            )
-
-        pm2 = MyPM2()
+        pm2 = ComparePM()
 
         pm.int_param = 100
         
@@ -1072,13 +1150,7 @@ class TestParameters(tm.TestCase):
     def test_operators(self):
         pm = self.pm
 
-        class MyPM2(ParameterManager):
-            param_defs = dict(
-                int_one=param_def(1, check_int, 'Integer parameter'),
-                int_two=param_def(2, check_int, 'Integer parameter'),
-            )
-
-        pm2 = MyPM2()
+        pm2 = OperandPM()
 
         # Integers
 
@@ -1406,13 +1478,7 @@ class TestParameters(tm.TestCase):
     def test_inplace_operators2(self):
         pm = self.pm
 
-        class MyPM2(ParameterManager):
-            param_defs = dict(
-                int_one=param_def(1, check_int, 'Integer parameter'),
-                float_one=param_def(1, check_float, 'Float parameter'),
-            )
-
-        pm2 = MyPM2()
+        pm2 = InplacePM()
 
         # Integers
 
@@ -1475,45 +1541,37 @@ class TestParameters(tm.TestCase):
         # Consecutive key/value pairs
 
         pm.set_params('int_param', 100, 'float_param', 8.98)
-        self.assertEqual(pm.params, {'int_param': 100, 'float_param': 8.98,
-                                     'str_param': 'some text'})
+        self._assert_params(pm, 100, 8.98, 'some text')
 
         with self.assertRaises(TypeError):
             pm.set_params(100, 200)
-        self.assertEqual(pm.params, {'int_param': 100, 'float_param': 8.98,
-                                     'str_param': 'some text'})
+        self._assert_params(pm, 100, 8.98, 'some text')
 
         with self.assertRaises(ValueError):
             pm.set_params('int_param')
-        self.assertEqual(pm.params, {'int_param': 100, 'float_param': 8.98,
-                                     'str_param': 'some text'})
+        self._assert_params(pm, 100, 8.98, 'some text')
 
         # Tuples of key/value pairs
 
         pm.set_params(('int_param', 200), ('str_param', 'foo bar'))
-        self.assertEqual(pm.params, {'int_param': 200, 'float_param': 8.98,
-                                     'str_param': 'foo bar'})
+        self._assert_params(pm, 200, 8.98, 'foo bar')
 
         with self.assertRaises(ValueError):
             pm.set_params(('int_param',))
-        self.assertEqual(pm.params, {'int_param': 200, 'float_param': 8.98,
-                                     'str_param': 'foo bar'})
+        self._assert_params(pm, 200, 8.98, 'foo bar')
 
         with self.assertRaises(ValueError):
             pm.set_params(('int_param', 100, 'int_param'))
-        self.assertEqual(pm.params, {'int_param': 200, 'float_param': 8.98,
-                                     'str_param': 'foo bar'})
+        self._assert_params(pm, 200, 8.98, 'foo bar')
 
         with self.assertRaises(TypeError):
             pm.set_params((100, 'int_param'))
-        self.assertEqual(pm.params, {'int_param': 200, 'float_param': 8.98,
-                                     'str_param': 'foo bar'})
+        self._assert_params(pm, 200, 8.98, 'foo bar')
 
         # Dictionaries
 
         pm.set_params({'str_param': 'new', 'int_param': 1000}) 
-        self.assertEqual(pm.params, {'int_param': 1000, 'float_param': 8.98,
-                                     'str_param': 'new'})
+        self._assert_params(pm, 1000, 8.98, 'new')
 
         with self.assertRaises(TypeError):
             pm.set_params({100: 200})
@@ -1521,76 +1579,46 @@ class TestParameters(tm.TestCase):
         # Keyword parameters
 
         pm.set_params(int_param=99, float_param=9.87)
-        self.assertEqual(pm.params, {'int_param': 99, 'float_param': 9.87,
-                                     'str_param': 'new'})
+        self._assert_params(pm, 99, 9.87, 'new')
 
         with self.assertRaises(ValueError):
             pm.set_params(int_param='foo')
 
         # Another ParameterManager
 
-        class MyPM2(ParameterManager):
-            param_defs = dict(
-                int_param=param_def(10000, check_int, 'Integer parameter'),
-                float_param=param_def(65, check_float, 'Float parameter'),
-            )
-
-        pm2 = MyPM2()
+        pm2 = IntFloatPM()
 
         pm.set_params(pm2)
-        self.assertEqual(pm.params, {'int_param': 10000, 'float_param': 65,
-                                     'str_param': 'new'})
+        self._assert_params(pm, 10000, 65, 'new')
         self.assertEqual(pm2.params, {'int_param': 10000, 'float_param': 65})
 
-        class MyPM2(ParameterManager):
-            param_defs = dict(
-                int_param=param_def(10000, check_int, 'Integer parameter'),
-                float_param=param_def(65, check_float, 'Float parameter'),
-                different_param=param_def(666, check_float, 'Float parameter'),
-            )
- 
-        pm2 = MyPM2()
+        pm2 = IntFloatExtraPM()
 
         with self.assertRaises(KeyError):
             pm.set_params(pm2)
-        self.assertEqual(pm.params, {'int_param': 10000, 'float_param': 65,
-                                     'str_param': 'new'})
+        self._assert_params(pm, 10000, 65, 'new')
         self.assertEqual(pm2.params, {'int_param': 10000, 'float_param': 65,
                                       'different_param': 666})
 
         # ParameterDict 
 
-        class MyPM2(ParameterManager):
-            param_defs = dict(
-                int_param=param_def(10000, check_int, 'Integer parameter'),
-                float_param=param_def(65, check_float, 'Float parameter'),
-            )
-
-        pm2 = MyPM2()
+        pm2 = IntFloatPM()
 
         pm2.int_param = 1
         pm2.float_param = 2
 
         pm.set_params(pm2.params)
 
-        self.assertEqual(pm.params, {'int_param': 1, 'float_param': 2,
-                                     'str_param': 'new'})
+        self._assert_params(pm, 1, 2, 'new')
         self.assertEqual(pm2.params, {'int_param': 1, 'float_param': 2})
 
         # Parameter
 
-        class MyPM2(ParameterManager):
-            param_defs = dict(
-                int_param=param_def(10000, check_int, 'Integer parameter'),
-                float_param=param_def(65, check_float, 'Float parameter'),
-            )
-
-        pm2 = MyPM2()
+        pm2 = IntFloatPM()
 
         pm.set_params(pm2.int_param, pm2.float_param)
 
-        self.assertEqual(pm.params, {'int_param': 10000, 'float_param': 65,
-                                     'str_param': 'new'})
+        self._assert_params(pm, 10000, 65, 'new')
         self.assertEqual(pm2.params, {'int_param': 10000, 'float_param': 65})
 
     def test_has_param(self):
@@ -1621,14 +1649,7 @@ class TestParameters(tm.TestCase):
     def test_seemingly_unreachable(self):
         pm = self.pm
 
-        class MyPM2(ParameterManager):
-            param_defs = dict(
-                int_one=param_def(1, check_int, 'Integer parameter'),
-                int_two=param_def(2, check_int, 'Integer parameter'),
-                float_one=param_def(2.5, check_float, 'Float parameter'),
-            )
-
-        pm2 = MyPM2()
+        pm2 = ReflectedPM()
 
         pm.int_param = 100
 
@@ -1680,20 +1701,7 @@ class TestParameters(tm.TestCase):
     def test_check_int_list(self):
         pm = self.pm
 
-        class MyPM2(ParameterManager):
-            param_defs = dict(
-                int_list=param_def(1,
-                                   functools.partial(check_int_list, allow_empty=True),
-                                   'Integer list parameter'),
-                other_list=param_def([10, 20, 30],
-                                     functools.partial(check_int_list, maximum=50, minimum=0),
-                                     'Other integer list parameter'),
-                none_list=param_def(2,
-                                    functools.partial(check_int_list, allow_none=True),
-                                    'Integer list parameter with None'),
-            )
-
-        pm2 = MyPM2()
+        pm2 = IntListPM()
 
         self.assertEqual(pm2.int_list, [1])
         self.assertEqual(pm2.other_list, [10, 20, 30])
@@ -1702,41 +1710,50 @@ class TestParameters(tm.TestCase):
         pm2.int_list = []
         self.assertEqual(pm2.int_list, [])
 
-        with self.assertRaises(ValueError):
-            pm2.other_list = [40, 50, 60]
+        self._assert_invalid(pm2, 'other_list', [40, 50, 60])
 
-        with self.assertRaises(ValueError):
-            pm2.other_list = [10, -1, 3]
+        self._assert_invalid(pm2, 'other_list', [10, -1, 3])
 
-        with self.assertRaises(ValueError):
-            pm2.other_list = None
+        pm2.other_list = list(range(0, 50, 5))
+        self.assertEqual(pm2.other_list, list(range(0, 50, 5)))
+        self.assertTrue(all(type(x) is int for x in pm2.other_list.get_value()))
+
+        self._assert_invalid(pm2, 'other_list', list(range(0, 50, 5)) + [-1])
+
+        # Short and long lists must fail the same way
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            for values in ([5] * 3, [5] * 20):
+                with self.assertRaises(ZeroDivisionError):
+                    check_int_list(values, multiple_of=0)
+            for values in ([5] * 3, [5] * 20):
+                with self.assertRaises(ValueError):
+                    check_int_list(values, multiple_of=2**70)
+                with self.assertRaises(ValueError):
+                    check_int_list(values, minimum=2**70)
+                self.assertEqual(check_int_list(values, maximum=2**70), values)
+
+        self._assert_invalid(pm2, 'other_list', None)
 
         pm2.none_list = None
         self.assertEqual(pm2.none_list, None)
 
-        with self.assertRaises(ValueError):
-            pm2.none_list = []
+        self._assert_invalid(pm2, 'none_list', [])
 
-        with self.assertRaises(ValueError):
-            pm2.int_list = [2, 3, 'foo']
+        self._assert_invalid(pm2, 'int_list', [2, 3, 'foo'])
+
+        # Assigning from another parameter must not share the list
+        pm3 = IntListPM()
+        pm3.other_list = [1, 2, 3]
+        pm2.other_list = pm3.other_list
+        pm3.other_list.get_value().append(4)
+        self.assertEqual(pm2.other_list, [1, 2, 3])
+        self.assertIsNot(pm2.other_list.get_value(), pm3.other_list.get_value())
 
     def test_check_float_list(self):
         pm = self.pm
 
-        class MyPM2(ParameterManager):
-            param_defs = dict(
-                float_list=param_def(1.2,
-                                   functools.partial(check_float_list, allow_empty=True),
-                                   'Float list parameter'),
-                other_list=param_def([10.5, 20.6, 30],
-                                     functools.partial(check_float_list, maximum=50, minimum=0),
-                                     'Other float list parameter'),
-                none_list=param_def(2.4,
-                                    functools.partial(check_float_list, allow_none=True),
-                                    'Float list parameter with None'),
-            )
-
-        pm2 = MyPM2()
+        pm2 = FloatListPM()
 
         self.assertEqual(pm2.float_list, [1.2])
         self.assertEqual(pm2.other_list, [10.5, 20.6, 30])
@@ -1745,41 +1762,39 @@ class TestParameters(tm.TestCase):
         pm2.float_list = []
         self.assertEqual(pm2.float_list, [])
 
-        with self.assertRaises(ValueError):
-            pm2.other_list = [40.8, 50.9, 60]
+        self._assert_invalid(pm2, 'other_list', [40.8, 50.9, 60])
 
-        with self.assertRaises(ValueError):
-            pm2.other_list = [10, -1.2, 3]
+        self._assert_invalid(pm2, 'other_list', [10, -1.2, 3])
 
-        with self.assertRaises(ValueError):
-            pm2.other_list = None
+        pm2.other_list = [x + 0.5 for x in range(0, 45, 5)] + [45]
+        self.assertEqual(pm2.other_list, [x + 0.5 for x in range(0, 45, 5)] + [45.0])
+        self.assertTrue(all(type(x) is float for x in pm2.other_list.get_value()))
+
+        self._assert_invalid(pm2, 'other_list', [x + 0.5 for x in range(0, 45, 5)] + [-1.2])
+
+        # Short and long lists must fail the same way
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            for values in ([5.5] * 3, [5.5] * 20):
+                with self.assertRaises(ZeroDivisionError):
+                    check_float_list(values, multiple_of=0)
+            for values in ([float('inf')] * 3, [float('inf')] * 20):
+                with self.assertRaises(ValueError):
+                    check_float_list(values, multiple_of=2)
+
+        self._assert_invalid(pm2, 'other_list', None)
 
         pm2.none_list = None
         self.assertEqual(pm2.none_list, None)
 
-        with self.assertRaises(ValueError):
-            pm2.none_list = []
+        self._assert_invalid(pm2, 'none_list', [])
 
-        with self.assertRaises(ValueError):
-            pm2.float_list = [2, 3, 'foo']
+        self._assert_invalid(pm2, 'float_list', [2, 3, 'foo'])
 
     def test_check_number_list(self):
         pm = self.pm
 
-        class MyPM2(ParameterManager):
-            param_defs = dict(
-                num_list=param_def(1.2,
-                                   functools.partial(check_number_list, allow_empty=True),
-                                   'Float list parameter'),
-                other_list=param_def([10.5, 20.6, 30],
-                                     functools.partial(check_number_list, maximum=50, minimum=0),
-                                     'Other number list parameter'),
-                none_list=param_def(2.4,
-                                    functools.partial(check_number_list, allow_none=True),
-                                    'Float list parameter with None'),
-            )
-
-        pm2 = MyPM2()
+        pm2 = NumberListPM()
 
         self.assertEqual(pm2.num_list, [1.2])
         self.assertEqual(pm2.other_list, [10.5, 20.6, 30])
@@ -1788,23 +1803,18 @@ class TestParameters(tm.TestCase):
         pm2.num_list = []
         self.assertEqual(pm2.num_list, [])
 
-        with self.assertRaises(ValueError):
-            pm2.other_list = [40.8, 50.9, 60]
+        self._assert_invalid(pm2, 'other_list', [40.8, 50.9, 60])
 
-        with self.assertRaises(ValueError):
-            pm2.other_list = [10, -1.2, 3]
+        self._assert_invalid(pm2, 'other_list', [10, -1.2, 3])
 
-        with self.assertRaises(ValueError):
-            pm2.other_list = None
+        self._assert_invalid(pm2, 'other_list', None)
 
         pm2.none_list = None
         self.assertEqual(pm2.none_list, None)
 
-        with self.assertRaises(ValueError):
-            pm2.none_list = []
+        self._assert_invalid(pm2, 'none_list', [])
 
-        with self.assertRaises(ValueError):
-            pm2.num_list = [2, 3, 'foo']
+        self._assert_invalid(pm2, 'num_list', [2, 3, 'foo'])
 
 
 if __name__ == '__main__':
@@ -27,6 +27,8 @@ import six
 from ..base import BaseTransformer
 from ..utils.params import splat
 
+_BIN_METHODS = frozenset(['bucket', 'quantile'])
+
 
 @six.python_2_unicode_compatible
 class Binner(BaseTransformer):
@@ -54,11 +56,13 @@ class Binner(BaseTransformer):
         self.method = method
         self.n_bins = n_bins
         self.inputs = inputs
+        self._validated_params = (method, n_bins, inputs)
 
     def _validate_params(self, method, n_bins, inputs):
-        method = method.lower()
-        if method not in ['bucket', 'quantile']:
-            raise ValueError('method must be either "bucket" or "quantile"')
+        if method not in _BIN_METHODS:
+            method = method.lower()
+            if method not in _BIN_METHODS:
+                raise ValueError('method must be either "bucket" or "quantile"')
         n_bins = max(1, int(n_bins))
         inputs = splat(inputs)
         return method, n_bins, inputs
@@ -90,14 +94,23 @@ class Binner(BaseTransformer):
         data set
 
         '''
-        if method is None:
-            method = self.method
-        if n_bins is None:
-            n_bins = self.n_bins
-        if inputs is None:
-            inputs = self.inputs
+        if method is None and n_bins is None and inputs is None:
+            method, n_bins, inputs = self.method, self.n_bins, self.inputs
+            # Values from the constructor don't need to be validated again.
+            # Compare by identity; e.g., 5.0 == 5 but still needs int().
+            valid_method, valid_n_bins, valid_inputs = self._validated_params
+            if method is not valid_method or n_bins is not valid_n_bins \
+                    or inputs is not valid_inputs:
+                method, n_bins, inputs = self._validate_params(method, n_bins, inputs)
+        else:
+            if method is None:
+                method = self.method
+            if n_bins is None:
+                n_bins = self.n_bins
+            if inputs is None:
+                inputs = self.inputs
 
-        method, n_bins, inputs = self._validate_params(method, n_bins, inputs)
+            method, n_bins, inputs = self._validate_params(method, n_bins, inputs)
             
         return self._get_super(table).transform(table, method=method,
                                                 n_bins=n_bins, inputs=inputs)
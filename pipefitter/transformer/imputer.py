@@ -24,14 +24,20 @@ Imputer clases
 from __future__ import print_function, division, absolute_import, unicode_literals
 
 import six
+from six.moves import intern
 from ..base import BaseImputer
+from ..utils.params import _get_slot_state, _set_slot_state
 
 
 @six.python_2_unicode_compatible
 class ImputerMethod(object):
     ''' Class for creating imputer method constants '''
 
+    __slots__ = ('name',)
+
     def __init__(self, name):
+        if isinstance(name, str):
+            name = intern(name)
         self.name = name
 
     def __str__(self):
@@ -40,6 +46,9 @@ class ImputerMethod(object):
     def __repr__(self):
         return str(self)
 
+    __getstate__ = _get_slot_state
+    __setstate__ = _set_slot_state
+
 
 @six.python_2_unicode_compatible
 class Imputer(BaseImputer):
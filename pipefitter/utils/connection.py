@@ -51,12 +51,11 @@ class ConnectionManager(object):
         Connection object
 
         '''
-        conn = None
-        if self._connection is not None:
-            try:
-                conn = self._connection()
-            except:
-                pass
+        # Dereferencing a weakref never raises; it returns None once the
+        # connection has been garbage collected
+        conn = self._connection
+        if conn is not None:
+            conn = conn()
         if conn is None:
             raise ValueError('No connection is currently registered')
         return conn
@@ -23,17 +23,24 @@ Parameter management utilities
 
 from __future__ import print_function, division, absolute_import, unicode_literals
 
-import collections
 import copy
+import itertools
 import math
 import numbers
+import operator
 import re
 import six
 import sys
 import textwrap
 import weakref
+from six.moves import intern
 from six.moves.urllib.parse import urlparse
 
+try:
+    from collections.abc import Iterable
+except ImportError:
+    from collections import Iterable
+
 # Parameter options
 READ_ONLY_PARAMETER = 1
 
@@ -56,6 +63,20 @@ def param_def(default=None, validator=None, doc=None, options=0, name=None, owne
     return dict(default=default, validator=validator, doc=doc,
                 options=options, name=name, owner=owner)
 
+_PARAMS_HEADER_RE = re.compile(r'\n\s*Parameters\s*-+\s*\n')
+_ANY_HEADER_RE = re.compile(r'\n\s*[A-Z]\w+\s*-+\s*\n')
+_PARAM_NAME_RE = re.compile(r'^(\w+)\s*:.*$\n', re.M)
+
+_PARAMS_DOC_CACHE = weakref.WeakKeyDictionary()
+
+# Template Parameters for the param_defs of each ParameterManager class
+_PARAM_TEMPLATES = weakref.WeakKeyDictionary()
+
+# Wraps parameter descriptions in ParameterDict.describe_parameter
+_DESCRIBE_FILL = textwrap.TextWrapper(initial_indent='    ',
+                                      subsequent_indent='    ').fill
+
+
 def get_params_doc(obj):
     '''
     Extract the parameter documentation from the given object 
@@ -72,17 +93,33 @@ def get_params_doc(obj):
         string associated with that name.
 
     '''
-    params_header = r'\n\s*Parameters\s*-+\s*\n'
-    any_header = r'\n\s*[A-Z]\w+\s*-+\s*\n'
-    
+    # Class docstrings don't change, so only parse them once
+    if isinstance(obj, type):
+        try:
+            return dict(_PARAMS_DOC_CACHE[obj])
+        except KeyError:
+            out = _PARAMS_DOC_CACHE[obj] = _parse_params_doc(obj)
+            return dict(out)
+    return _parse_params_doc(obj)
+
+
+def _parse_params_doc(obj):
+    ''' Parse the parameter documentation for `get_params_doc` '''
+    # Classes with a __doc__ slot (e.g., Parameter) have a descriptor here
     doc = getattr(obj, '__doc__', '')
-    if not doc or not re.search(params_header, doc):
+    if not doc or not isinstance(doc, six.string_types):
+        return dict()
+
+    # Locate the section with searches and slice it out once, rather than
+    # splitting (and copying) the whole docstring at each header
+    start = _PARAMS_HEADER_RE.search(doc)
+    if start is None:
         return dict()
 
-    params = re.split(params_header, doc)[1]
-    params = re.split(any_header, params)[0].rstrip()
+    end = _ANY_HEADER_RE.search(doc, start.end())
+    params = doc[start.end():end.start() if end is not None else len(doc)].rstrip()
     params = textwrap.dedent(params)
-    params = re.split(r'^(\w+)\s*:.*$\n', params, flags=re.M)[1:]
+    params = _PARAM_NAME_RE.split(params)[1:]
 
     dociter = iter(params)
     params = [(x, textwrap.dedent(y).rstrip()) for x, y in zip(dociter, dociter)]
@@ -91,7 +128,13 @@ def get_params_doc(obj):
 
 
 class param_property(object):
-    ''' Accessor for parameters '''
+#
+# NOTE: The class docstring is a comment because `__doc__` is a slot
+#       holding the docstring of the parameter.
+#
+#   ''' Accessor for parameters '''
+
+    __slots__ = ('name', '__doc__')
 
     def __init__(self, name, doc):
         self.name = name
@@ -118,10 +161,14 @@ class ParameterManager(object):
     def __init__(self, **kwargs):
         self.params = ParameterDict()
 
-        params_doc = get_params_doc(type(self))
+        cls = type(self)
+        params_doc = get_params_doc(cls)
+
+        # Validated parameters built from this class's definitions
+        templates = _PARAM_TEMPLATES.setdefault(cls, {})
 
         # Create parameters from arguments
-        for key, value in type(self).param_defs.items():
+        for key, value in cls.param_defs.items():
             if isinstance(value, Parameter):
                 value = value.copy()
                 value._name = key
@@ -130,15 +177,30 @@ class ParameterManager(object):
                     value.__doc__ = params_doc.get(key, '')
                 out = self.params.add_parameter(value)
             else:
-                value = value.copy()
-                value['name'] = key
-                value['owner'] = self
-                if not value.get('doc', None):
-                    value['doc'] = params_doc.get(key, '')
-                out = self.params.add_parameter(**value)
+                # Validate each default once per class and copy it from then on.
+                # The template is rebuilt if the definition has been changed
+                # in place since it was created.
+                template = templates.get(key)
+                snapshot = dict(value)
+                snapshot['default'] = copy.copy(snapshot.get('default'))
+                if template is None or template[0] != snapshot:
+                    pdef = value.copy()
+                    pdef['name'] = key
+                    pdef['owner'] = None
+                    if not pdef.get('doc', None):
+                        pdef['doc'] = params_doc.get(key, '')
+                    template = templates[key] = (snapshot, Parameter(**pdef))
+                template = template[1]
+                value = template.copy()
+                value._options = template._options
+                value._default = value._value = copy.copy(template._default)
+                value._owner = self
+                out = self.params.add_parameter(value)
 
-            # Add a property to the class for each parameter
-            setattr(type(self), out._name, param_property(out._name, out.__doc__))
+            # Add a property to the class for each parameter (only needed
+            # the first time the class is instantiated)
+            if not isinstance(cls.__dict__.get(out._name), param_property):
+                setattr(cls, out._name, param_property(out._name, out.__doc__))
 
         self.set_params(**kwargs)
 
@@ -218,12 +280,14 @@ class ParameterManager(object):
         {'int_value': 100, 'float_value': 1.23}
 
         '''
-        out = self.params.copy()
+        # Values are only set through item assignment, so the Parameters
+        # themselves don't need to be copied
+        out = self.params._shallow_copy()
 
         if kwargs:
-            argiter = iter(list(args) + [kwargs])
+            argiter = itertools.chain(args, [kwargs])
         else:
-            argiter = iter(list(args))
+            argiter = iter(args)
 
         specific_params = {}
 
@@ -261,8 +325,9 @@ class ParameterManager(object):
             else:
                 raise TypeError('Unknown type for parameter: %s' % arg)
 
-        for key, value in specific_params.items():
-            out[key] = value
+        # Parameter keys take precedence over plain string keys
+        if specific_params:
+            out.update(specific_params)
 
         return out.to_dict()
 
@@ -286,12 +351,14 @@ class ParameterManager(object):
         {'int_value': 101, 'str_value': 'foo'}
 
         '''
-        out = self.params.copy()
+        # Values are only set through item assignment, so the Parameters
+        # themselves don't need to be copied
+        out = self.params._shallow_copy()
 
         if kwargs:
-            argiter = iter(list(args) + [kwargs])
+            argiter = itertools.chain(args, [kwargs])
         else:
-            argiter = iter(list(args))
+            argiter = iter(args)
 
         specific_params = {}
 
@@ -333,12 +400,52 @@ class ParameterManager(object):
             else:
                 raise TypeError('Unknown type for parameter: %s' % arg)
 
-        for key, value in specific_params.items():
-            out[key] = value
+        # Parameter keys take precedence over plain string keys
+        if specific_params:
+            out.update(specific_params)
 
         return out.to_dict()
 
 
+# Lists longer than this are validated with NumPy rather than item by item
+_VECTORIZE_MIN_LENGTH = 8
+
+# Compiled versions of the pattern strings given to the string validators.
+# The cache is emptied when it fills up (as the re module does) so that
+# dynamically generated patterns can't grow it without bound.
+_PATTERN_CACHE = {}
+_PATTERN_CACHE_SIZE = 256
+
+
+def _compile_pattern(pattern):
+    ''' Return the compiled regular expression for a pattern string '''
+    try:
+        return _PATTERN_CACHE[pattern]
+    except KeyError:
+        if len(_PATTERN_CACHE) >= _PATTERN_CACHE_SIZE:
+            _PATTERN_CACHE.clear()
+        out = _PATTERN_CACHE[pattern] = re.compile(pattern)
+        return out
+
+
+def _check_items(values, func, message, **kwargs):
+    '''
+    Validate each item of a list
+
+    Returns a new list of the validated values.  A ValueError from `func`
+    is re-raised using `message` formatted with the offending item.
+
+    '''
+    out = []
+    append = out.append
+    for item in values:
+        try:
+            append(func(item, **kwargs))
+        except ValueError:
+            raise ValueError(message % item)
+    return out
+
+
 def check_variable(value, pattern=None, valid_values=None, normalize=False,
                    allow_none=True):
     '''
@@ -405,15 +512,16 @@ def check_variable_list(values, pattern=None, valid_values=None,
     if not isinstance(values, (list, tuple, set)):
         values = [values]
 
-    values = list(values)
+    if not isinstance(values, list):
+        values = list(values)
 
-    for i, item in enumerate(values):
-        try:
-            values[i] = check_string(item, pattern=pattern,
-                                     valid_values=valid_values,
-                                     normalize=normalize)
-        except ValueError:
-            raise ValueError('%s is not a valid variable name' % item)
+    # Compile once rather than for each item in the list
+    if isinstance(pattern, six.string_types):
+        pattern = _compile_pattern(pattern)
+
+    values = _check_items(values, check_string, '%s is not a valid variable name',
+                          pattern=pattern, valid_values=valid_values,
+                          normalize=normalize)
 
     if not allow_empty and not values:
         raise ValueError('The variable list is empty')
@@ -478,6 +586,54 @@ def check_int(value, minimum=None, maximum=None, exclusive_minimum=False,
     return out
 
 
+def _check_array(values, kinds, dtype, minimum=None, maximum=None,
+                 exclusive_minimum=False, exclusive_maximum=False,
+                 multiple_of=None):
+    '''
+    Validate a long list of numbers in a single vectorized pass
+
+    Returns the list of converted values, or None if the list could not
+    be validated this way.  Callers fall back to the per-item checks in
+    that case so that the usual error messages are raised.
+
+    '''
+    if len(values) <= _VECTORIZE_MIN_LENGTH:
+        return
+    if multiple_of is not None:
+        # Leave zero and non-finite divisors to the per-item checks so
+        # that they fail the same way regardless of the list length
+        try:
+            multiple_of = int(multiple_of)
+        except (TypeError, ValueError, OverflowError):
+            return
+        if multiple_of == 0:
+            return
+
+    # Imported here since only the long-list path needs NumPy
+    import numpy as np
+
+    arr = np.asarray(values)
+    if arr.ndim != 1 or arr.dtype.kind not in kinds:
+        return
+    arr = arr.astype(dtype)
+    if arr.dtype.kind == 'f' and not np.isfinite(arr).all():
+        return
+    # Bounds and divisors that don't fit the array type are also left
+    # to the per-item checks
+    try:
+        if minimum is not None:
+            if (arr < minimum).any() or (exclusive_minimum and (arr == minimum).any()):
+                return
+        if maximum is not None:
+            if (arr > maximum).any() or (exclusive_maximum and (arr == maximum).any()):
+                return
+        if multiple_of is not None and (arr % multiple_of != 0).any():
+            return
+    except (OverflowError, TypeError):
+        return
+    return arr.tolist()
+
+
 def check_int_list(values, minimum=None, maximum=None, exclusive_minimum=False,
                    exclusive_maximum=False, multiple_of=None, allow_empty=False,
                    allow_none=False):
@@ -520,16 +676,21 @@ def check_int_list(values, minimum=None, maximum=None, exclusive_minimum=False,
     if not isinstance(values, (list, tuple, set)):
         values = [values]
 
-    values = list(values)
+    if not isinstance(values, list):
+        values = list(values)
 
-    for i, item in enumerate(values):
-        try:
-            values[i] = check_int(item, minimum=minimum, maximum=maximum,
-                                  exclusive_minimum=exclusive_minimum,
-                                  exclusive_maximum=exclusive_maximum,
-                                  multiple_of=multiple_of)
-        except ValueError:
-            raise ValueError('%s is not a valid integer value' % item)
+    out = _check_array(values, 'i', 'int64', minimum=minimum, maximum=maximum,
+                       exclusive_minimum=exclusive_minimum,
+                       exclusive_maximum=exclusive_maximum,
+                       multiple_of=multiple_of)
+    if out is not None:
+        return out
+
+    values = _check_items(values, check_int, '%s is not a valid integer value',
+                          minimum=minimum, maximum=maximum,
+                          exclusive_minimum=exclusive_minimum,
+                          exclusive_maximum=exclusive_maximum,
+                          multiple_of=multiple_of)
 
     if not allow_empty and not values:
         raise ValueError('The integer list is empty')
@@ -636,16 +797,21 @@ def check_float_list(values, minimum=None, maximum=None, exclusive_minimum=False
     if not isinstance(values, (list, tuple, set)):
         values = [values]
 
-    values = list(values)
+    if not isinstance(values, list):
+        values = list(values)
 
-    for i, item in enumerate(values):
-        try:
-            values[i] = check_float(item, minimum=minimum, maximum=maximum,
-                                    exclusive_minimum=exclusive_minimum,
-                                    exclusive_maximum=exclusive_maximum,
-                                    multiple_of=multiple_of)
-        except ValueError:
-            raise ValueError('%s is not a valid float value' % item)
+    out = _check_array(values, 'iuf', 'float64', minimum=minimum, maximum=maximum,
+                       exclusive_minimum=exclusive_minimum,
+                       exclusive_maximum=exclusive_maximum,
+                       multiple_of=multiple_of)
+    if out is not None:
+        return out
+
+    values = _check_items(values, check_float, '%s is not a valid float value',
+                          minimum=minimum, maximum=maximum,
+                          exclusive_minimum=exclusive_minimum,
+                          exclusive_maximum=exclusive_maximum,
+                          multiple_of=multiple_of)
 
     if not allow_empty and not values:
         raise ValueError('The float list is empty')
@@ -661,7 +827,7 @@ def check_number_or_iter(value, minimum=None, maximum=None, exclusive_minimum=Fa
         return value
     if isinstance(value, six.string_types):
         raise TypeError('Type must be numeric or iterable')
-    elif isinstance(value, collections.Iterable):
+    elif isinstance(value, Iterable):
         return value
     return check_number(value, minimum=minimum, maximum=maximum,
                         exclusive_minimum=exclusive_minimum,
@@ -708,19 +874,28 @@ def check_number_list(values, minimum=None, maximum=None, exclusive_minimum=Fals
     if not isinstance(values, (list, tuple, set)):
         values = [values]
 
-    values = list(values)
+    if not isinstance(values, list):
+        values = list(values)
+
+    # Only all-integer lists can be vectorized; a mixed list of ints and
+    # floats would lose the distinction between the int and float bounds.
+    out = _check_array(values, 'i', 'int64',
+                       minimum=minimum if minimum_int is None else minimum_int,
+                       maximum=maximum if maximum_int is None else maximum_int,
+                       exclusive_minimum=exclusive_minimum,
+                       exclusive_maximum=exclusive_maximum,
+                       multiple_of=multiple_of)
+    if out is not None:
+        return out
 
-    for i, item in enumerate(values):
-        try:
-            values[i] = check_number(item, minimum=minimum, maximum=maximum,
-                                     exclusive_minimum=exclusive_minimum,
-                                     exclusive_maximum=exclusive_maximum,
-                                     multiple_of=multiple_of,
-                                     minimum_int=minimum_int, maximum_int=maximum_int,
-                                     minimum_float=minimum_float,
-                                     maximum_float=maximum_float)
-        except ValueError:
-            raise ValueError('%s is not a valid number value' % item)
+    values = _check_items(values, check_number, '%s is not a valid number value',
+                          minimum=minimum, maximum=maximum,
+                          exclusive_minimum=exclusive_minimum,
+                          exclusive_maximum=exclusive_maximum,
+                          multiple_of=multiple_of,
+                          minimum_int=minimum_int, maximum_int=maximum_int,
+                          minimum_float=minimum_float,
+                          maximum_float=maximum_float)
 
     if not allow_empty and not values:
         raise ValueError('The number list is empty')
@@ -728,6 +903,9 @@ def check_number_list(values, minimum=None, maximum=None, exclusive_minimum=Fals
     return values
 
 
+_BOOLEAN_INTS = frozenset([0, 1])
+
+
 def check_boolean(value):
     '''
     Validate a boolean value
@@ -744,19 +922,16 @@ def check_boolean(value):
         The validated boolean
 
     '''
-    if not isinstance(value, bool) and not isinstance(value, six.integer_types):
-        raise TypeError('Boolean values must be bools or integers')
-
-    if value is False or value is True:
+    if value is True or value is False:
         return value
 
-    if isinstance(value, six.integer_types):
-        if value == 1:
-            return True
-        if value == 0:
-            return False
+    if not isinstance(value, six.integer_types):
+        raise TypeError('Boolean values must be bools or integers')
+
+    if value in _BOOLEAN_INTS:
+        return bool(value)
 
-    raise ValueError('%s is not a boolean or proper integer value')
+    raise ValueError('%s is not a boolean or proper integer value' % value)
 
 
 def check_string(value, pattern=None, max_length=None, min_length=None,
@@ -808,7 +983,7 @@ def check_string(value, pattern=None, max_length=None, min_length=None,
 
     if pattern is not None:
         if isinstance(pattern, six.string_types):
-            if not re.search(pattern, out):
+            if not _compile_pattern(pattern).search(out):
                 raise ValueError('"%s" does not match pattern "%s"' % (out, pattern))
         elif not pattern.search(out):
             raise ValueError('"%s" does not match pattern %s' % (out, pattern))
@@ -820,6 +995,9 @@ def check_string(value, pattern=None, max_length=None, min_length=None,
     return out
 
 
+_SIMPLE_URL_RE = re.compile(r'^[A-Za-z][A-Za-z0-9+.\-]*://[!-Z\\^-~]*$')
+
+
 def check_url(value, pattern=None, max_length=None, min_length=None, valid_values=None):
     '''
     Validate a URL value
@@ -850,11 +1028,63 @@ def check_url(value, pattern=None, max_length=None, min_length=None, valid_value
     out = check_string(six.text_type(value), pattern=pattern, max_length=max_length,
                        min_length=min_length, valid_values=valid_values)
 
-    urlparse(out)
+    # urlparse can only fail on brackets (IPv6 hosts) or non-ASCII hosts,
+    # so plain absolute URLs don't need to be parsed.
+    if not _SIMPLE_URL_RE.match(out):
+        urlparse(out)
 
     return out
 
 
+# Data slot names of Parameter and its subclasses, used by Parameter.copy
+_SLOT_NAMES = weakref.WeakKeyDictionary()
+
+
+def _get_slot_names(cls):
+    ''' Return the names of the data slots declared along the MRO of `cls` '''
+    try:
+        return _SLOT_NAMES[cls]
+    except KeyError:
+        pass
+    names = []
+    for base in cls.__mro__:
+        slots = base.__dict__.get('__slots__', ())
+        if isinstance(slots, six.string_types):
+            slots = (slots,)
+        for name in slots:
+            if name.startswith('__') and not name.endswith('__'):
+                name = '_%s%s' % (base.__name__.lstrip('_'), name)
+            if name not in ('__dict__', '__weakref__') and name not in names:
+                names.append(name)
+    out = _SLOT_NAMES[cls] = tuple(names)
+    return out
+
+
+def _get_slot_state(obj):
+    '''
+    Return the pickle state of an object that uses __slots__
+
+    Slotted classes need an explicit __getstate__ to be pickled with
+    protocols 0 and 1 (the default on Python 2.7).
+
+    '''
+    state = {}
+    for name in _get_slot_names(type(obj)):
+        try:
+            state[name] = getattr(obj, name)
+        except AttributeError:
+            pass
+    if type(obj).__dictoffset__:
+        state.update(obj.__dict__)
+    return state
+
+
+def _set_slot_state(obj, state):
+    ''' Restore the state returned by :func:`_get_slot_state` '''
+    for name, value in state.items():
+        setattr(obj, name, value)
+
+
 @six.python_2_unicode_compatible
 class Parameter(object):
 # 
@@ -888,19 +1118,26 @@ class Parameter(object):
 
     param_ids = {}
 
+    # Subclasses that declare __slots__ must repeat '__doc__' in them,
+    # since the class docstring would otherwise hide the slot.
+    # copy() picks up the slots of every class in the MRO.
+    __slots__ = ('_owner', '_name', '_validator', '_default', '_value',
+                 '_options', '_is_set', '__doc__')
+
     def __init__(self, owner, name, default, validator=None, doc=None, options=0):
-        if validator is None:
-            validator = lambda x: x
+        if isinstance(name, str):
+            name = intern(name)
         self._owner = owner
         self._name = name
         self._validator = validator
-        self._default = validator(default)
+        self._default = default if validator is None else validator(default)
         self._value = self._default
         self._options = options
         self._is_set = False
         self.__doc__ = doc and doc.rstrip() or ''
-        type(self).param_ids.setdefault(self._name,
-                                        '1%0.4d' % len(type(self).param_ids))
+        param_ids = type(self).param_ids
+        if name not in param_ids:
+            param_ids[name] = '1%0.4d' % len(param_ids)
 
     def __str__(self):
         return six.text_type(self._value)
@@ -921,7 +1158,10 @@ class Parameter(object):
         if self._options & READ_ONLY_PARAMETER:
             raise RuntimeError('%s is a read-only parameter' % self._name)
         self._is_set = True
-        self._value = self._validator(value)
+        if self._validator is None:
+            self._value = value
+        else:
+            self._value = self._validator(value)
 
     def get_value(self):
         ''' Return the value of the option '''
@@ -941,10 +1181,17 @@ class Parameter(object):
 
     def copy(self):
         ''' Return a copy of the parameter '''
-        out = type(self)(self._owner, self._name, self._default, self._validator, '')
-        out._value = self._value
-        out._is_set = self._is_set
-        out.__doc__ = self.__doc__
+        # Bypass __init__ so that the default isn't run through the validator again
+        cls = type(self)
+        out = cls.__new__(cls)
+        for name in _get_slot_names(cls):
+            try:
+                setattr(out, name, getattr(self, name))
+            except AttributeError:
+                pass
+        if cls.__dictoffset__:
+            out.__dict__.update(self.__dict__)
+        out._options = 0
         return out
 
     def __copy__(self):
@@ -953,286 +1200,166 @@ class Parameter(object):
     def __deepcopy__(self, memo=None):
         return self.copy()
 
+    __getstate__ = _get_slot_state
+    __setstate__ = _set_slot_state
+
     def __hash__(self):
-        return int(type(self).param_ids[self._name] + str(id(self._owner)))
+        return hash((type(self).param_ids[self._name], id(self._owner)))
 
     # Numeric operations
 
-    def __add__(self, other):
+    def _binary_op(self, func, other):
         if isinstance(other, Parameter):
             other = other._value
         out = self.copy()
-        out.set_value(out._value + other)
+        out.set_value(func(out._value, other))
         return out
 
-    def __sub__(self, other):
+    def _reflected_op(self, func, other):
         if isinstance(other, Parameter):
-            other = other._value
+            return other._binary_op(func, self._value)
         out = self.copy()
-        out.set_value(out._value - other)
+        out.set_value(func(other, out._value))
         return out
 
-    def __mul__(self, other):
+    def _inplace_op(self, func, other):
         if isinstance(other, Parameter):
             other = other._value
+        self.set_value(func(self._value, other))
+        return self
+
+    def _unary_op(self, func, *args):
         out = self.copy()
-        out.set_value(out._value * other)
+        out.set_value(func(out._value, *args))
         return out
 
+    def __add__(self, other):
+        return self._binary_op(operator.add, other)
+
+    def __sub__(self, other):
+        return self._binary_op(operator.sub, other)
+
+    def __mul__(self, other):
+        return self._binary_op(operator.mul, other)
+
     def __truediv__(self, other):
-        if isinstance(other, Parameter):
-            other = other._value
-        out = self.copy()
-        out.set_value(out._value / other)
-        return out
+        return self._binary_op(operator.truediv, other)
 
     def __floordiv__(self, other):
-        if isinstance(other, Parameter):
-            other = other._value
-        out = self.copy()
-        out.set_value(out._value // other)
-        return out
+        return self._binary_op(operator.floordiv, other)
 
     def __mod__(self, other):
-        if isinstance(other, Parameter):
-            other = other._value
-        out = self.copy()
-        out.set_value(out._value % other)
-        return out
+        return self._binary_op(operator.mod, other)
 
 # Result is a tuple, not a single value
 #   def __divmod__(self, other):
-#       if isinstance(other, Parameter):
-#           other = other._value
-#       out = self.copy()
-#       out.set_value(divmod(out._value, other))
-#       return out
+#       return self._binary_op(divmod, other)
 
     def __pow__(self, other):
-        if isinstance(other, Parameter):
-            other = other._value
-        out = self.copy()
-        out.set_value(out._value ** other)
-        return out
+        return self._binary_op(operator.pow, other)
 
     def __lshift__(self, other):
-        if isinstance(other, Parameter):
-            other = other._value
-        out = self.copy()
-        out.set_value(out._value << other)
-        return out
+        return self._binary_op(operator.lshift, other)
 
     def __rshift__(self, other):
-        if isinstance(other, Parameter):
-            other = other._value
-        out = self.copy()
-        out.set_value(out._value >> other)
-        return out
+        return self._binary_op(operator.rshift, other)
 
     def __and__(self, other):
-        if isinstance(other, Parameter):
-            other = other._value
-        out = self.copy()
-        out.set_value(out._value & other)
-        return out
+        return self._binary_op(operator.and_, other)
 
     def __xor__(self, other):
-        if isinstance(other, Parameter):
-            other = other._value
-        out = self.copy()
-        out.set_value(out._value ^ other)
-        return out
+        return self._binary_op(operator.xor, other)
 
     def __or__(self, other):
-        if isinstance(other, Parameter):
-            other = other._value
-        out = self.copy()
-        out.set_value(out._value | other)
-        return out
+        return self._binary_op(operator.or_, other)
 
     def __radd__(self, other):
-        if isinstance(other, Parameter):
-            return other.__add__(self._value)
-        out = self.copy()
-        out.set_value(other + out._value)
-        return out
+        return self._reflected_op(operator.add, other)
 
     def __rsub__(self, other):
-        if isinstance(other, Parameter):
-            return other.__sub__(self._value)
-        out = self.copy()
-        out.set_value(other - out._value)
-        return out
+        return self._reflected_op(operator.sub, other)
 
     def __rmul__(self, other):
-        if isinstance(other, Parameter):
-            return other.__mul__(self._value)
-        out = self.copy()
-        out.set_value(other * out._value)
-        return out
+        return self._reflected_op(operator.mul, other)
 
     def __rtruediv__(self, other):
-        if isinstance(other, Parameter):
-            return other.__truediv__(self._value)
-        out = self.copy()
-        out.set_value(other / out._value)
-        return out
+        return self._reflected_op(operator.truediv, other)
 
     def __rfloordiv__(self, other):
-        if isinstance(other, Parameter):
-            return other.__floordiv__(self._value)
-        out = self.copy()
-        out.set_value(other // out._value)
-        return out
+        return self._reflected_op(operator.floordiv, other)
 
     def __rmod__(self, other):
-        if isinstance(other, Parameter):
-            return other.__mod__(self._value)
-        out = self.copy()
-        out.set_value(other % out._value)
-        return out
+        return self._reflected_op(operator.mod, other)
 
 # Result is a tuple, not a single value
 #   def __rdivmod__(self, other):
-#       if isinstance(other, Parameter):
-#           return other.__divmod__(self._value)
-#       out = self.copy()
-#       out.set_value(divmod(other, out._value))
-#       return out
+#       return self._reflected_op(divmod, other)
 
     def __rpow__(self, other):
-        if isinstance(other, Parameter):
-            return other.__pow__(self._value)
-        out = self.copy()
-        out.set_value(other ** out._value)
-        return out
+        return self._reflected_op(operator.pow, other)
 
     def __rlshift__(self, other):
-        if isinstance(other, Parameter):
-            return other.__lshift__(self._value)
-        out = self.copy()
-        out.set_value(other << out._value)
-        return out
+        return self._reflected_op(operator.lshift, other)
 
     def __rrshift__(self, other):
-        if isinstance(other, Parameter):
-            return other.__rshift__(self._value)
-        out = self.copy()
-        out.set_value(other >> out._value)
-        return out
+        return self._reflected_op(operator.rshift, other)
 
     def __rand__(self, other):
-        if isinstance(other, Parameter):
-            return other.__and__(self._value)
-        out = self.copy()
-        out.set_value(other & out._value)
-        return out
+        return self._reflected_op(operator.and_, other)
 
     def __rxor__(self, other):
-        if isinstance(other, Parameter):
-            return other.__xor__(self._value)
-        out = self.copy()
-        out.set_value(other ^ out._value)
-        return out
+        return self._reflected_op(operator.xor, other)
 
     def __ror__(self, other):
-        if isinstance(other, Parameter):
-            return other.__or__(self._value)
-        out = self.copy()
-        out.set_value(other | out._value)
-        return out
+        return self._reflected_op(operator.or_, other)
 
     def __iadd__(self, other):
-        if isinstance(other, Parameter):
-            other = other._value
-        self.set_value(self._value + other)
-        return self
+        return self._inplace_op(operator.add, other)
 
     def __isub__(self, other):
-        if isinstance(other, Parameter):
-            other = other._value
-        self.set_value(self._value - other)
-        return self
+        return self._inplace_op(operator.sub, other)
 
     def __imul__(self, other):
-        if isinstance(other, Parameter):
-            other = other._value
-        self.set_value(self._value * other)
-        return self
+        return self._inplace_op(operator.mul, other)
 
     def __itruediv__(self, other):
-        if isinstance(other, Parameter):
-            other = other._value
-        self.set_value(self._value / other)
-        return self
+        return self._inplace_op(operator.truediv, other)
 
     def __ifloordiv__(self, other):
-        if isinstance(other, Parameter):
-            other = other._value
-        self.set_value(self._value // other)
-        return self
+        return self._inplace_op(operator.floordiv, other)
 
     def __imod__(self, other):
-        if isinstance(other, Parameter):
-            other = other._value
-        self.set_value(self._value % other)
-        return self
+        return self._inplace_op(operator.mod, other)
 
     def __ipow__(self, other):
-        if isinstance(other, Parameter):
-            other = other._value
-        self.set_value(self._value ** other)
-        return self
+        return self._inplace_op(operator.pow, other)
 
     def __ilshift__(self, other):
-        if isinstance(other, Parameter):
-            other = other._value
-        self.set_value(self._value << other)
-        return self
+        return self._inplace_op(operator.lshift, other)
 
     def __irshift__(self, other):
-        if isinstance(other, Parameter):
-            other = other._value
-        self.set_value(self._value >> other)
-        return self
+        return self._inplace_op(operator.rshift, other)
 
     def __iand__(self, other):
-        if isinstance(other, Parameter):
-            other = other._value
-        self.set_value(self._value & other)
-        return self
+        return self._inplace_op(operator.and_, other)
 
     def __ixor__(self, other):
-        if isinstance(other, Parameter):
-            other = other._value
-        self.set_value(self._value ^ other)
-        return self
+        return self._inplace_op(operator.xor, other)
 
     def __ior__(self, other):
-        if isinstance(other, Parameter):
-            other = other._value
-        self.set_value(self._value | other)
-        return self
+        return self._inplace_op(operator.or_, other)
 
     def __neg__(self):
-        out = self.copy()
-        out.set_value(-out._value)
-        return out
+        return self._unary_op(operator.neg)
 
     def __pos__(self):
-        out = self.copy()
-        out.set_value(+out._value)
-        return out
+        return self._unary_op(operator.pos)
 
     def __abs__(self):
-        out = self.copy()
-        out.set_value(abs(out._value))
-        return out
+        return self._unary_op(abs)
 
     def __invert__(self):
-        out = self.copy()
-        out.set_value(~out._value)
-        return out
+        return self._unary_op(operator.invert)
 
 #   def __complex__(self):
 #       out = self.copy()
@@ -1240,30 +1367,28 @@ class Parameter(object):
 #       return out
 
     def __int__(self):
-        return int(self._value)
+        value = self._value
+        if type(value) is int:
+            return value
+        return int(value)
 
     def __float__(self):
-        return float(self._value)
+        value = self._value
+        if type(value) is float:
+            return value
+        return float(value)
 
     def __round__(self, n=0):
-        out = self.copy()
-        out.set_value(round(out._value, n))
-        return out
+        return self._unary_op(round, n)
 
     def __ceil__(self):
-        out = self.copy()
-        out.set_value(math.ceil(out._value))
-        return out
+        return self._unary_op(math.ceil)
 
     def __floor__(self):
-        out = self.copy()
-        out.set_value(math.floor(out._value))
-        return out
+        return self._unary_op(math.floor)
 
     def __trunc__(self):
-        out = self.copy()
-        out.set_value(math.trunc(out._value))
-        return out
+        return self._unary_op(math.trunc)
 
     # Comparison operators
 
@@ -1273,7 +1398,9 @@ class Parameter(object):
         return self._value == other 
 
     def __ne__(self, other):
-        return not self.__eq__(other)
+        if isinstance(other, Parameter):
+            other = other._value
+        return self._value != other
 
     def __lt__(self, other):
         if isinstance(other, Parameter):
@@ -1296,13 +1423,18 @@ class Parameter(object):
         return self._value >= other
 
     def __bool__(self):
-        return bool(self._value)
+        value = self._value
+        if value is True or value is False:
+            return value
+        return bool(value)
 
 
 @six.python_2_unicode_compatible
 class ParameterDict(object):
     ''' Dictionary-like object that validates key/value pairs '''
 
+    __slots__ = ('_params',)
+
     def __init__(self, *args, **kwargs):
        self._params = {} 
        self.add_parameter(*args, **kwargs)
@@ -1355,7 +1487,7 @@ class ParameterDict(object):
     def describe_parameter(self, *keys, **kwargs):
         output = kwargs.get('output', sys.stdout)
         last = len(keys) - 1
-        indent = textwrap.TextWrapper(initial_indent='    ', subsequent_indent='    ').fill
+        indent = _DESCRIBE_FILL
         for i, key in enumerate(keys):
             param = self._params[key]
             output.write(param._name)
@@ -1377,85 +1509,138 @@ class ParameterDict(object):
                 return default[0]
             raise
 
+    def _set_from_manager(self, arg, argiter):
+        self.update(dict(arg.params.items()))
+
+    def _set_from_mapping(self, arg, argiter):
+        self.update(dict(arg.items()))
+
+    def _set_from_parameter(self, arg, argiter):
+        self[arg._name] = arg
+
+    def _set_from_pair(self, arg, argiter):
+        if len(arg) < 2:
+            raise ValueError('Parameter for "%s" is missing a value')
+        if len(arg) > 2:
+            raise ValueError('Too many elements in parameter tuple: %s' % (arg,))
+        if not isinstance(arg[0], six.string_types):
+            raise TypeError('Key is not a string: %s' % arg[0])
+        self[arg[0]] = arg[1]
+
+    def _set_from_key(self, arg, argiter):
+        try:
+            self[arg] = next(argiter)
+        except StopIteration:
+            raise ValueError('Parameter "%s" is missing a value')
+
+    # Handlers for the argument types to `set` that are checked after
+    # ParameterManagers and mappings.  `_get_set_handler` tries them with
+    # isinstance in this order, so keep the order when adding types.
+    _set_arg_types = (
+        ((Parameter,), _set_from_parameter),
+        ((list, tuple), _set_from_pair),
+        (six.string_types, _set_from_key),
+    )
+
+    # Exact-type lookups for the common argument types, built from the
+    # table above.  Subclasses fall back to `_get_set_handler`.
+    _set_handlers = dict((cls, handler) for types, handler in _set_arg_types
+                         for cls in types)
+    _set_handlers[dict] = _set_from_mapping
+
+    def _get_set_handler(self, arg):
+        if isinstance(arg, ParameterManager):
+            return type(self)._set_from_manager
+        elif hasattr(arg, 'items') and callable(arg.items):
+            return type(self)._set_from_mapping
+        for types, handler in self._set_arg_types:
+            if isinstance(arg, types):
+                return handler
+        raise TypeError('Unknown type for parameter: %s' % arg)
+
     def set(self, *args, **kwargs):
         '''
         Set one or more parameters
 
         '''
-        argiter = iter(args)
-        for arg in argiter:
-            if isinstance(arg, ParameterManager):
-                self.update(dict(arg.params.items()))
-            elif hasattr(arg, 'items') and callable(arg.items):
-                self.update(dict(arg.items()))
-            elif isinstance(arg, Parameter):
-                self[arg._name] = arg
-            elif isinstance(arg, (list, tuple)):
-                if len(arg) < 2:
-                    raise ValueError('Parameter for "%s" is missing a value')
-                if len(arg) > 2:
-                    raise ValueError('Too many elements in parameter tuple: %s' % (arg,))
-                if not isinstance(arg[0], six.string_types):
-                    raise TypeError('Key is not a string: %s' % arg[0])
-                self[arg[0]] = arg[1]
-            elif isinstance(arg, six.string_types):
-                try:
-                    self[arg] = next(argiter)
-                except StopIteration:
-                    raise ValueError('Parameter "%s" is missing a value')
-            else:
-                raise TypeError('Unknown type for parameter: %s' % arg)
+        if args:
+            argiter = iter(args)
+            for arg in argiter:
+                handler = self._set_handlers.get(type(arg))
+                if handler is None:
+                    handler = self._get_set_handler(arg)
+                handler(self, arg, argiter)
 
-        self.update(kwargs)
+        if kwargs:
+            self.update(kwargs)
 
     def __getitem__(self, key):
         if isinstance(key, Parameter):
             key = key._name
         return self._params[key].get_value()
 
-    def __setitem__(self, key, value):
+    def _validate_item(self, key, value):
+        ''' Return the key and a validated copy of the parameter for `value` '''
         if isinstance(key, Parameter):
             key = key._name
         if not isinstance(key, six.string_types):
             raise TypeError('Key values must be strings: %s' % key)
-        if key not in self._params:
+        param = self._params.get(key)
+        if param is None:
             raise KeyError('%s is not a valid parameter key for this object' % key)
-        if key in self._params and self._params[key]._options & READ_ONLY_PARAMETER:
+        if param._options & READ_ONLY_PARAMETER:
             raise RuntimeError('%s is a read-only parameter' % key)
+        out = param.copy()
         if isinstance(value, Parameter):
+            # Values from a parameter with the same validator (e.g., the
+            # result of arithmetic on this parameter) are already valid.
+            # The value is still copied so that mutable values such as
+            # lists aren't shared between the two parameters.
+            if value._validator is param._validator:
+                out._value = copy.copy(value._value)
+                out._is_set = True
+                return key, out
             value = value._value
-        out = self._params[key].copy()
         out.set_value(value)
+        return key, out
+
+    def __setitem__(self, key, value):
+        key, out = self._validate_item(key, value)
         self._params[key] = out
 
     def update(self, *args, **kwargs):
-        for item in (list(args) + [kwargs]):
+        # Validate everything before storing anything so that a bad value
+        # doesn't leave the dictionary partially updated
+        items = []
+        for item in args:
             if hasattr(item, 'items') and callable(item.items):
                 for key, value in item.items():
-                    self[key] = value
+                    items.append(self._validate_item(key, value))
             elif isinstance(item, Parameter):
-                self[item._name] = item._value
+                items.append(self._validate_item(item._name, item._value))
             else:
-                self[item[0]] = item[1]
+                items.append(self._validate_item(item[0], item[1]))
+        for key, value in kwargs.items():
+            items.append(self._validate_item(key, value))
+        self._params.update(items)
 
     def keys(self):
-        return list(self._params.keys())
+        return list(self._params)
 
     def values(self):
-        return [x.get_value() for x in self._params.values()]
+        return [x._value for x in self._params.values()]
 
     def items(self):
-        return [(x, self._params[x]) for x in self._params.keys()]
+        return list(self._params.items())
 
     def __iter__(self):
-        for key in self.keys():
-            yield key
+        return iter(self._params)
 
     def __contains__(self, key):
-        return key in self._params.keys() 
+        return key in self._params
 
     def __len__(self):
-        return len(self._params.keys())
+        return len(self._params)
 
     def copy(self):
         out = type(self)()
@@ -1463,21 +1648,44 @@ class ParameterDict(object):
             out.add_parameter(value.copy())
         return out
 
+    def _shallow_copy(self):
+        '''
+        Return a copy that shares the Parameter objects of `self`
+
+        This is only safe for short-lived copies whose values are changed
+        exclusively through item assignment (which replaces Parameters
+        rather than modifying them).
+
+        '''
+        out = type(self)()
+        out._params = dict(self._params)
+        return out
+
     def __copy__(self):
         return self.copy()
 
     def __deepcopy__(self, memo=None):
         return self.copy()
 
+    __getstate__ = _get_slot_state
+    __setstate__ = _set_slot_state
+
     def __eq__(self, other):
-        if hasattr(other, 'items') and callable(other.items):
-            newdict = {}
-            for key, value in other.items():
-                if isinstance(key, Parameter):
-                    key = key._name 
-                newdict[key] = value
-            other = newdict
-        return dict(self.items()) == other
+        if not hasattr(other, 'items') or not callable(other.items):
+            return False
+        # Normalize Parameter keys first; they may duplicate string keys
+        newdict = {}
+        for key, value in other.items():
+            if isinstance(key, Parameter):
+                key = key._name
+            newdict[key] = value
+        if len(newdict) != len(self._params):
+            return False
+        for key, value in newdict.items():
+            param = self._params.get(key)
+            if param is None or (param is not value and not (param == value)):
+                return False
+        return True
 
     def to_dict(self):
-        return {k: v._value for k, v in self.items()} 
+        return {k: v._value for k, v in self._params.items()}